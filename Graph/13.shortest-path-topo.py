@@ -80,7 +80,8 @@ WHEN TO USE THIS ALGORITHM:
 4. Need optimal O(V+E) performance
 
 ❌ DON'T USE when:
-1. Graph has cycles (use Dijkstra or Bellman-Ford)
+1. Graph has cycles (use Dijkstra or Bellman-Ford - or findShortestPathGeneral:
+   topo order over the SCC condensation, Dijkstra only inside cycles)
 2. Graph is undirected (convert to directed or use Dijkstra)
 3. Need all-pairs shortest path (use Floyd-Warshall)
 
@@ -106,6 +107,13 @@ PYTHON INTERNALS:
 - Set for visited: O(1) lookup
 """
 
+import heapq
+import importlib.util
+import os
+from array import array
+from functools import lru_cache
+
+
 def findShortestPath(graph, start, V):
     # Step 1: Initialize distances - O(V)
     distance = [float('inf') for _ in range(V)]
@@ -143,6 +151,235 @@ def topologicalSort(graph, start, visited, stack):
     # (nodes with no dependencies first)
     return stack[::-1]
 
+def findShortestPathSoA(graph, start, V):
+    """
+    Same DAG shortest path on struct-of-arrays edges:
+    graph[u] = (neighbors, weights) parallel arrays (adjacencyListDirectedDict(..., structOfArrays=True)).
+
+    The relax loop indexes both arrays - no (neighbor, wt) tuple per edge.
+    Topological order comes from an explicit-stack DFS (post-order), so deep DAGs
+    don't hit the recursion limit either.
+    """
+    distance = [float('inf')] * V
+    distance[start] = 0
+
+    # Post-order DFS from start with an explicit stack of (node, next index)
+    visited = {start}
+    order = []
+    stack = [(start, 0)]
+    while stack:
+        node, i = stack.pop()
+        neighbors = graph[node][0] if node in graph else ()
+        if i < len(neighbors):
+            stack.append((node, i + 1))
+            neighbor = neighbors[i]
+            if neighbor not in visited:
+                visited.add(neighbor)
+                stack.append((neighbor, 0))
+        else:
+            order.append(node)
+
+    for node in reversed(order):  # Topological order
+        if node not in graph:
+            continue
+        neighbors, weights = graph[node]
+        base = distance[node]
+        for i in range(len(neighbors)):
+            neighbor = neighbors[i]
+            if distance[neighbor] > base + weights[i]:
+                distance[neighbor] = base + weights[i]
+
+    return distance
+
+
+# Same VertexInterner as 1-representation.py (scripts are standalone, so it is copied
+# verbatim - keep the copies identical: intern / idOf / internEdges / internAdjacency / translate)
+class VertexInterner:
+    """
+    Maps arbitrary hashable vertex IDs ("JFK", (3, 4), uuid...) to dense ints 0..V-1.
+
+    Why: algorithms like dijkstra keep state in flat lists (distance = [inf] * V).
+    With string IDs you'd need dicts for distance/visited/parent - every access hashes.
+    Intern ONCE at build time, run the hot loop on ints, translate the answer back.
+
+    Time:
+        - intern(id): O(1) average (one dict lookup, append on first sight)
+        - idOf(i): O(1) list index
+        - internEdges / internAdjacency: O(V + E)
+        - translate(values): O(V)
+
+    Space: O(V) - one dict + one list
+
+    Example:
+        interner = VertexInterner()
+        interner.intern("SFO") → 0, interner.intern("JFK") → 1, interner.intern("SFO") → 0
+        interner.translate([0, 7]) → {"SFO": 0, "JFK": 7}
+    """
+
+    def __init__(self):
+        self.index = {}  # id → dense int
+        self.ids = []    # dense int → id
+
+    def intern(self, vertexId) -> int:
+        dense = self.index.get(vertexId)
+        if dense is None:
+            dense = len(self.ids)
+            self.index[vertexId] = dense
+            self.ids.append(vertexId)
+        return dense
+
+    def idOf(self, dense: int):
+        return self.ids[dense]
+
+    def internEdges(self, edges):
+        """Lazily rewrite [u, v, *rest] edges to dense ids (streams - no copy of the list)."""
+        intern = self.intern
+        for edge in edges:
+            yield [intern(edge[0]), intern(edge[1]), *edge[2:]]
+
+    def internAdjacency(self, graph: dict) -> dict:
+        """
+        Rewrite {id: [(id, weight), ...]} to {dense: [(dense, weight), ...]}.
+        Every interned vertex gets a row (neighbor-only ones get []), so dense code can index graph[v].
+        """
+        intern = self.intern
+        dense = {}
+        for node, edges in graph.items():
+            dense[intern(node)] = [(intern(neighbor), weight) for neighbor, weight in edges]
+        for v in range(len(self.ids)):
+            dense.setdefault(v, [])
+        return dense
+
+    def translate(self, values) -> dict:
+        """Dense per-vertex results (list/array indexed by 0..V-1) → {id: value}."""
+        return {self.ids[i]: value for i, value in enumerate(values)}
+
+    def translatePath(self, path) -> list:
+        return [self.ids[i] for i in path]
+
+    def __contains__(self, vertexId) -> bool:
+        return vertexId in self.index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def findShortestPathLabeled(graph, start):
+    """
+    Same DAG shortest path, but vertices can be ANY hashable id ("build", "test", ...).
+
+    Thin wrapper: VertexInterner maps ids → dense 0..V-1 once (O(V + E)),
+    findShortestPath runs on flat lists, translate() maps distances back.
+    Returns {vertex id: distance}.
+    """
+    interner = VertexInterner()
+    source = interner.intern(start)
+    denseGraph = interner.internAdjacency(graph)
+    return interner.translate(findShortestPath(denseGraph, source, len(interner)))
+
+
+@lru_cache(maxsize=None)
+def loadScript(fileName):
+    """Numbered scripts can't be imported by name - load a sibling file by path (once)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), fileName)
+    spec = importlib.util.spec_from_file_location(fileName[:-3].replace('-', '_').replace('.', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def stronglyConnectedComponents(graph, V):
+    """
+    Tarjan SCC for weighted adjacency lists (graph[u] = [(v, wt), ...]).
+
+    Not a second copy: runs Solution.stronglyConnectedComponents from
+    7-detect-cycle-in-directed.py on a neighbor-only view (O(E) to build).
+    Returns (labels, count) with labels in topological order of the
+    condensation: edge u→v ⇒ labels[u] <= labels[v].
+    """
+    neighbors = {u: [v for v, _ in edges] for u, edges in graph.items()}
+    return loadScript('7-detect-cycle-in-directed.py').Solution().stronglyConnectedComponents(neighbors, V)
+
+
+def findShortestPathGeneral(graph, start, V):
+    """
+    Same single-source shortest path, but the graph may have CYCLES.
+
+    Run the DAG algorithm on the condensation (one node per SCC):
+        1. Tarjan → labels already in topological order of the SCC DAG
+        2. Components before labels[start] can't be reached → skip them
+        3. For each component in order:
+             - single node, no self-loop → plain DAG step (relax its edges)
+             - cycle → settle it internally: Dijkstra seeded with the
+               distances that arrived from earlier components
+               (Bellman-Ford inside the SCC if it has a negative edge)
+             - then relax edges leaving the component
+    Negative weights on edges BETWEEN components are fine, like the DAG
+    version. Raises ValueError on a negative cycle reachable from start.
+
+    Time: O(V + E) on a DAG; O(V + E + Σ Ec log Vc) with cycles
+          (Ec, Vc = edges/nodes inside each cyclic SCC)
+    Space: O(V)
+    """
+    labels, count = stronglyConnectedComponents(graph, V)
+    members = [[] for _ in range(count)]
+    for v in range(V):
+        members[labels[v]].append(v)
+
+    distance = [float('inf')] * V
+    distance[start] = 0
+
+    for c in range(labels[start], count):
+        group = members[c]
+        cyclic = len(group) > 1 or any(neighbor == group[0] for neighbor, _ in graph.get(group[0], ()))
+        if cyclic:
+            settleComponent(graph, group, c, labels, distance)
+
+        for node in group:  # Edges leaving the component - the DAG relaxation
+            base = distance[node]
+            if base == float('inf'):
+                continue
+            for neighbor, wt in graph.get(node, ()):
+                if labels[neighbor] != c and distance[neighbor] > base + wt:
+                    distance[neighbor] = base + wt
+
+    return distance
+
+
+def settleComponent(graph, group, c, labels, distance):
+    """Shortest distances inside one SCC, starting from whatever already reached it."""
+    inside = [(node, [(neighbor, wt) for neighbor, wt in graph.get(node, ()) if labels[neighbor] == c])
+              for node in group]
+
+    if all(wt >= 0 for _, edges in inside for _, wt in edges):
+        heap = [(distance[node], node) for node in group if distance[node] != float('inf')]
+        heapq.heapify(heap)
+        adjacency = dict(inside)
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > distance[node]:
+                continue  # Stale entry
+            for neighbor, wt in adjacency[node]:
+                if distance[neighbor] > d + wt:
+                    distance[neighbor] = d + wt
+                    heapq.heappush(heap, (d + wt, neighbor))
+        return
+
+    for _ in range(len(group)):  # Bellman-Ford restricted to the SCC
+        changed = False
+        for node, edges in inside:
+            base = distance[node]
+            if base == float('inf'):
+                continue
+            for neighbor, wt in edges:
+                if distance[neighbor] > base + wt:
+                    distance[neighbor] = base + wt
+                    changed = True
+        if not changed:
+            return
+    raise ValueError("negative cycle reachable from start")
+
+
 def main():
     V = 6
     graph ={
@@ -156,6 +393,23 @@ def main():
 
     print(findShortestPath(graph, 0, V))
 
+    soa = {u: (array('i', [v for v, _ in edges]), array('q', [w for _, w in edges])) for u, edges in graph.items()}
+    print(findShortestPathSoA(soa, 0, V))
+
+    tasks = {"fetch": [("build", 2)], "build": [("test", 5), ("package", 1)], "test": [("package", 1)]}
+    print(findShortestPathLabeled(tasks, "fetch"))
+
+    # Cycle 1 → 2 → 3 → 1: findShortestPath assumes a DAG, the SCC version doesn't
+    cyclic = {
+        0: [(1, 4), (4, 1)],
+        1: [(2, 1)],
+        2: [(3, 2)],
+        3: [(1, 1), (5, 3)],
+        4: [(2, -2)],
+        5: []
+    }
+    print(findShortestPathGeneral(cyclic, 0, V))  # [0, 2, -1, 1, 1, 4]
+
 if __name__ == '__main__':
     main()
 
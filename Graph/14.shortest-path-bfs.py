@@ -1,4 +1,5 @@
 #for undirected unweighed graph
+from array import array
 from collections import deque
 def findShortestPath(graph, start, V, target):
     distance = [ float('inf') for _ in range(V)]
@@ -15,6 +16,112 @@ def findShortestPath(graph, start, V, target):
     return distance[target]
 
 
+# Repeated queries on the same graph: keep state in arrays and reuse it.
+# Same BFSWorkspace as 3-bfs.py (scripts are standalone, so it is copied
+# verbatim - keep the copies identical, including the generation rule).
+class BFSWorkspace:
+    """
+    Reusable visited/distance state for repeated BFS queries on dense IDs 0..V-1.
+
+    Allocate once per graph, pass to every query - no per-query set/dict.
+    Results of the LAST query stay readable until the next one starts.
+
+    Generation rule (same in 3-bfs.py, 14.shortest-path-bfs.py and
+    DFSWorkspace in 4.dfs.py): stamp[v] == generation ⟺ v seen in the
+    current query; generations run 1..255, then one clear and back to 1.
+
+    Space: 5 bytes per vertex
+    """
+
+    def __init__(self, V: int):
+        self.V = V
+        self.stamp = bytearray(V)
+        self.dist = array('i', bytes(4 * V))
+        self.generation = 0
+        self._zeros = bytes(V)
+
+    def next_generation(self) -> int:
+        """Start a new query: O(1) except one clear every 255 queries."""
+        if self.generation == 255:
+            self.stamp[:] = self._zeros
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def visited(self, v: int) -> bool:
+        return self.stamp[v] == self.generation
+
+    def distance(self, v: int) -> int:
+        """Distance found by the last query, -1 if v was not reached."""
+        return self.dist[v] if self.stamp[v] == self.generation else -1
+
+    @classmethod
+    def for_graph(cls, V: int, workspace = None) -> 'BFSWorkspace':
+        """A fresh workspace for V vertices, or the given one if it is big enough."""
+        if workspace is None:
+            return cls(V)
+        if workspace.V < V:
+            raise ValueError(f"workspace holds {workspace.V} vertices, graph needs V={V}")
+        return workspace
+
+
+def out_of_range(V: int, error: LookupError) -> ValueError:
+    """Dense paths index stamp/dist/graph directly - turn a bad id into a clear error."""
+    return ValueError(f"dense BFS/DFS needs every vertex id in 0..{V - 1} with a row in graph "
+                      f"(pass V = max id + 1): {error!r}")
+
+
+def findShortestPathDense(graph, start, V, target, workspace=None):
+    workspace = BFSWorkspace.for_graph(V, workspace)
+    generation = workspace.next_generation()
+    stamp, dist = workspace.stamp, workspace.dist
+    if start == target:
+        return 0
+    try:
+        stamp[start] = generation
+        dist[start] = 0
+        queue = [start]
+        for node in queue:  # list as queue: iteration picks up appended nodes
+            level = dist[node] + 1
+            for neighbor in graph[node]:
+                if stamp[neighbor] != generation:
+                    if neighbor == target:
+                        return level
+                    stamp[neighbor] = generation
+                    dist[neighbor] = level
+                    queue.append(neighbor)
+    except LookupError as error:
+        raise out_of_range(workspace.V, error) from error
+    return float('inf')  # Same "unreachable" value as findShortestPath
+
+
+def compareWorkspace(V=50_000, degree=4, queries=50, seed=0):
+    import random
+    import time
+    rng = random.Random(seed)
+    graph = {u: [] for u in range(V)}
+    for u in range(V):
+        for _ in range(degree // 2):
+            v = rng.randrange(V)
+            graph[u].append(v)
+            graph[v].append(u)
+    pairs = [(rng.randrange(V), rng.randrange(V)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    expected = [findShortestPath(graph, s, V, t) for s, t in pairs]
+    listTime = time.perf_counter() - start
+
+    workspace = BFSWorkspace(V)
+    start = time.perf_counter()
+    result = [findShortestPathDense(graph, s, V, t, workspace) for s, t in pairs]
+    denseTime = time.perf_counter() - start
+
+    print(f"{queries} queries, V={V:,}")
+    print(f"findShortestPath (new list per query): {listTime*1000:8.1f}ms")
+    print(f"findShortestPathDense (workspace):     {denseTime*1000:8.1f}ms "
+          f"({listTime/denseTime:.1f}x), same: {result == expected}")
+
+
 def main():
     V = 6
     graph ={
@@ -27,10 +134,13 @@ def main():
     }
 
     print(findShortestPath(graph, 0, V, 5))
+    workspace = BFSWorkspace(V)
+    print(findShortestPathDense(graph, 0, V, 5, workspace))
+    print(findShortestPathDense(graph, 2, V, 5, workspace))
+    compareWorkspace()
 
 if __name__ == '__main__':
     main()
   
         
 
-
@@ -144,7 +144,8 @@ EDGE CASES:
 """
 
 import heapq
-from typing import List, Dict, Tuple
+from array import array
+from typing import List, Dict, Tuple, Hashable
 
 
 def dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int, V: int) -> List[float]:
@@ -256,6 +257,245 @@ def reconstruct_path(parent: Dict[int, int], start: int, end: int) -> List[int]:
     return path if path[0] == start else []
 
 
+# ============================================================================
+# STRUCT-OF-ARRAYS EDGES: graph[u] = (neighbors array, weights array)
+# ============================================================================
+def to_struct_of_arrays(graph: Dict[int, List[Tuple[int, int]]]) -> Dict[int, Tuple[array, array]]:
+    """
+    (neighbor, weight) tuple lists → parallel typed arrays per vertex.
+    Same layout as adjacencyListDirectedDict(..., structOfArrays=True).
+
+    Memory per edge: ~72 B (tuple + list slot) → 12 B (int32 + int64)
+    """
+    soa = {}
+    for node, edges in graph.items():
+        neighbors = array('i', [neighbor for neighbor, _ in edges])
+        weights = [weight for _, weight in edges]
+        soa[node] = (neighbors, array('d' if any(isinstance(w, float) for w in weights) else 'q', weights))
+    return soa
+
+
+def dijkstra_soa(graph: Dict[int, Tuple[array, array]], start: int, V: int) -> List[float]:
+    """
+    dijkstra() over struct-of-arrays edges: the relax loop indexes two flat arrays
+    instead of unpacking a (neighbor, weight) tuple per edge.
+
+    Time: O((V + E) log V) - same algorithm, smaller constant
+    Space: O(V)
+    """
+    distance = [float('inf')] * V
+    distance[start] = 0
+    pq = [(0, start)]
+    visited = set()
+
+    while pq:
+        curr_dist, node = heapq.heappop(pq)
+        if node in visited:
+            continue
+        visited.add(node)
+        if curr_dist > distance[node]:
+            continue
+
+        if node in graph:
+            neighbors, weights = graph[node]
+            for i in range(len(neighbors)):  # Index both arrays - no tuple per edge
+                neighbor = neighbors[i]
+                new_dist = curr_dist + weights[i]
+                if new_dist < distance[neighbor]:
+                    distance[neighbor] = new_dist
+                    heapq.heappush(pq, (new_dist, neighbor))
+
+    return distance
+
+
+def compare_tuples_vs_soa(V: int = 100_000, E: int = 800_000, seed: int = 0):
+    """Benchmark: memory of the two edge layouts and dijkstra vs dijkstra_soa time."""
+    import random
+    import time
+    import tracemalloc
+
+    rng = random.Random(seed)
+    pairs = [(rng.randrange(V), rng.randrange(V), rng.randint(1, 100)) for _ in range(E)]
+
+    tracemalloc.start()
+    graph = {u: [] for u in range(V)}
+    for u, v, w in pairs:
+        graph[u].append((v, w))
+    tuple_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    soa = to_struct_of_arrays(graph)
+    soa_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    expected = dijkstra(graph, 0, V)
+    tuple_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    result = dijkstra_soa(soa, 0, V)
+    soa_time = time.perf_counter() - t0
+
+    print(f"=== (v, w) tuples vs struct-of-arrays (V={V:,}, E={E:,}) ===")
+    print(f"tuples: {tuple_bytes/1e6:7.1f} MB, dijkstra {tuple_time*1000:7.1f}ms")
+    print(f"SoA:    {soa_bytes/1e6:7.1f} MB, dijkstra {soa_time*1000:7.1f}ms ({tuple_time/soa_time:.2f}x)")
+    print(f"Same distances: {expected == result}")
+
+
+# ============================================================================
+# NON-INTEGER VERTEX IDS: intern once, run dense, translate back
+# ============================================================================
+# Same VertexInterner as 1-representation.py (scripts are standalone, so it is copied
+# verbatim - keep the copies identical: intern / idOf / internEdges / internAdjacency / translate)
+class VertexInterner:
+    """
+    Maps arbitrary hashable vertex IDs ("JFK", (3, 4), uuid...) to dense ints 0..V-1.
+
+    Why: algorithms like dijkstra keep state in flat lists (distance = [inf] * V).
+    With string IDs you'd need dicts for distance/visited/parent - every access hashes.
+    Intern ONCE at build time, run the hot loop on ints, translate the answer back.
+
+    Time:
+        - intern(id): O(1) average (one dict lookup, append on first sight)
+        - idOf(i): O(1) list index
+        - internEdges / internAdjacency: O(V + E)
+        - translate(values): O(V)
+
+    Space: O(V) - one dict + one list
+
+    Example:
+        interner = VertexInterner()
+        interner.intern("SFO") → 0, interner.intern("JFK") → 1, interner.intern("SFO") → 0
+        interner.translate([0, 7]) → {"SFO": 0, "JFK": 7}
+    """
+
+    def __init__(self):
+        self.index = {}  # id → dense int
+        self.ids = []    # dense int → id
+
+    def intern(self, vertexId) -> int:
+        dense = self.index.get(vertexId)
+        if dense is None:
+            dense = len(self.ids)
+            self.index[vertexId] = dense
+            self.ids.append(vertexId)
+        return dense
+
+    def idOf(self, dense: int):
+        return self.ids[dense]
+
+    def internEdges(self, edges):
+        """Lazily rewrite [u, v, *rest] edges to dense ids (streams - no copy of the list)."""
+        intern = self.intern
+        for edge in edges:
+            yield [intern(edge[0]), intern(edge[1]), *edge[2:]]
+
+    def internAdjacency(self, graph: dict) -> dict:
+        """
+        Rewrite {id: [(id, weight), ...]} to {dense: [(dense, weight), ...]}.
+        Every interned vertex gets a row (neighbor-only ones get []), so dense code can index graph[v].
+        """
+        intern = self.intern
+        dense = {}
+        for node, edges in graph.items():
+            dense[intern(node)] = [(intern(neighbor), weight) for neighbor, weight in edges]
+        for v in range(len(self.ids)):
+            dense.setdefault(v, [])
+        return dense
+
+    def translate(self, values) -> dict:
+        """Dense per-vertex results (list/array indexed by 0..V-1) → {id: value}."""
+        return {self.ids[i]: value for i, value in enumerate(values)}
+
+    def translatePath(self, path) -> list:
+        return [self.ids[i] for i in path]
+
+    def __contains__(self, vertexId) -> bool:
+        return vertexId in self.index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def dijkstra_labeled(graph: Dict[Hashable, List[Tuple[Hashable, int]]], start: Hashable) -> Dict[Hashable, float]:
+    """
+    Dijkstra for string/tuple/any-hashable vertex IDs.
+
+    Thin wrapper: VertexInterner maps IDs to 0..V-1, the flat-list dijkstra()
+    above runs unchanged, translate() maps distances back. The O((V+E) log V) hot loop never hashes a vertex ID.
+
+    Returns:
+        {vertex id: shortest distance} (unreachable → inf, start → 0 even
+        if it only appears as a neighbor or not at all)
+    """
+    interner = VertexInterner()
+    source = interner.intern(start)  # Interned first, so a neighbor-only or unknown start still gets 0
+    dense_graph = interner.internAdjacency(graph)
+    return interner.translate(dijkstra(dense_graph, source, len(interner)))
+
+
+def dijkstra_dict_state(graph: Dict[Hashable, List[Tuple[Hashable, int]]], start: Hashable) -> Dict[Hashable, float]:
+    """
+    Same algorithm with dict-based state (what you write without interning).
+    Kept as the baseline for compare_dense_vs_dict().
+    """
+    distance = {node: float('inf') for node in graph}
+    for edges in graph.values():
+        for neighbor, _ in edges:
+            distance.setdefault(neighbor, float('inf'))
+    distance[start] = 0
+    pq = [(0, start)]
+    visited = set()
+
+    while pq:
+        curr_dist, node = heapq.heappop(pq)
+        if node in visited:
+            continue
+        visited.add(node)
+        for neighbor, weight in graph.get(node, ()):
+            new_dist = curr_dist + weight
+            if new_dist < distance[neighbor]:
+                distance[neighbor] = new_dist
+                heapq.heappush(pq, (new_dist, neighbor))
+
+    return distance
+
+
+def compare_dense_vs_dict(V: int = 50_000, E: int = 250_000, seed: int = 0):
+    """
+    Benchmark: string-ID graph, dict-state Dijkstra vs interned dense-ID Dijkstra.
+    Interning cost is reported separately - it is paid once per graph, not per query.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    names = [f"node-{i:07d}" for i in range(V)]
+    graph = {name: [] for name in names}
+    for _ in range(E):
+        graph[names[rng.randrange(V)]].append((names[rng.randrange(V)], rng.randint(1, 100)))
+
+    t0 = time.perf_counter()
+    baseline = dijkstra_dict_state(graph, names[0])
+    dict_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    interner = VertexInterner()
+    dense_graph = interner.internAdjacency(graph)
+    intern_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    distance = dijkstra(dense_graph, interner.index[names[0]], len(interner))
+    dense_time = time.perf_counter() - t0
+    result = interner.translate(distance)
+
+    print(f"=== Dijkstra on string IDs (V={V:,}, E={E:,}) ===")
+    print(f"dict state:        {dict_time*1000:8.1f}ms")
+    print(f"dense ids (query): {dense_time*1000:8.1f}ms ({dict_time/dense_time:.2f}x)")
+    print(f"interning (once):  {intern_time*1000:8.1f}ms")
+    print(f"Same distances: {result == baseline}")
+
+
 # ============================================================================
 # EXAMPLE USAGE
 # ============================================================================
@@ -301,6 +541,19 @@ def main():
             else:
                 print(f"  0 � {node}: No path exists")
 
+    print()
+
+    # Same graph with airport-style string IDs
+    names = ["SFO", "JFK", "LAX", "ORD", "SEA"]
+    labeled = {names[u]: [(names[v], w) for v, w in edges] for u, edges in graph.items()}
+    print(f"Labeled distances from SFO: {dijkstra_labeled(labeled, 'SFO')}")
+
+    print()
+    compare_dense_vs_dict(V=20_000, E=100_000)
+
+    print()
+    compare_tuples_vs_soa(V=50_000, E=400_000)
+
 
 if __name__ == '__main__':
     main()
@@ -116,6 +116,93 @@ Track (node, stops) separately - visiting node 1 with stops=2 is DIFFERENT
 from visiting node 1 with stops=4, even if cost is higher!
 """
 
+# Same VertexInterner as 1-representation.py (scripts are standalone, so it is copied
+# verbatim - keep the copies identical: intern / idOf / internEdges / internAdjacency / translate)
+class VertexInterner:
+    """
+    Maps arbitrary hashable vertex IDs ("JFK", (3, 4), uuid...) to dense ints 0..V-1.
+
+    Why: algorithms like dijkstra keep state in flat lists (distance = [inf] * V).
+    With string IDs you'd need dicts for distance/visited/parent - every access hashes.
+    Intern ONCE at build time, run the hot loop on ints, translate the answer back.
+
+    Time:
+        - intern(id): O(1) average (one dict lookup, append on first sight)
+        - idOf(i): O(1) list index
+        - internEdges / internAdjacency: O(V + E)
+        - translate(values): O(V)
+
+    Space: O(V) - one dict + one list
+
+    Example:
+        interner = VertexInterner()
+        interner.intern("SFO") → 0, interner.intern("JFK") → 1, interner.intern("SFO") → 0
+        interner.translate([0, 7]) → {"SFO": 0, "JFK": 7}
+    """
+
+    def __init__(self):
+        self.index = {}  # id → dense int
+        self.ids = []    # dense int → id
+
+    def intern(self, vertexId) -> int:
+        dense = self.index.get(vertexId)
+        if dense is None:
+            dense = len(self.ids)
+            self.index[vertexId] = dense
+            self.ids.append(vertexId)
+        return dense
+
+    def idOf(self, dense: int):
+        return self.ids[dense]
+
+    def internEdges(self, edges):
+        """Lazily rewrite [u, v, *rest] edges to dense ids (streams - no copy of the list)."""
+        intern = self.intern
+        for edge in edges:
+            yield [intern(edge[0]), intern(edge[1]), *edge[2:]]
+
+    def internAdjacency(self, graph: dict) -> dict:
+        """
+        Rewrite {id: [(id, weight), ...]} to {dense: [(dense, weight), ...]}.
+        Every interned vertex gets a row (neighbor-only ones get []), so dense code can index graph[v].
+        """
+        intern = self.intern
+        dense = {}
+        for node, edges in graph.items():
+            dense[intern(node)] = [(intern(neighbor), weight) for neighbor, weight in edges]
+        for v in range(len(self.ids)):
+            dense.setdefault(v, [])
+        return dense
+
+    def translate(self, values) -> dict:
+        """Dense per-vertex results (list/array indexed by 0..V-1) → {id: value}."""
+        return {self.ids[i]: value for i, value in enumerate(values)}
+
+    def translatePath(self, path) -> list:
+        return [self.ids[i] for i in path]
+
+    def __contains__(self, vertexId) -> bool:
+        return vertexId in self.index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def findCheapestPriceLabeled(flights: List[list], src, dst, k: int) -> int:
+    """
+    Cheapest price when airports are codes ("SFO") instead of 0..n-1.
+
+    Thin wrapper: VertexInterner maps codes → dense ints once, then
+    findCheapestPrice runs unchanged.
+    Time: O(E) extra for interning.
+    """
+    interner = VertexInterner()
+    denseFlights = list(interner.internEdges(flights))
+    if src not in interner or dst not in interner:
+        return 0 if src == dst else -1
+    return findCheapestPrice(len(interner), denseFlights, interner.intern(src), interner.intern(dst), k)
+
+
 def main():
     flights = [[0,3,3],[3,4,3],[4,1,3],[0,5,1],[5,1,100],[0,6,2],[6,1,100],
                [0,7,1],[7,8,1],[8,9,1],[9,1,1],[1,10,1],[10,2,1],[1,2,100]]
@@ -124,6 +211,9 @@ def main():
     print(f"Result: {result}")  # Expected: 11
     # Path: 0→3(3) → 4(3) → 1(3) → 10(1) → 2(1) = 11, stops=4 ✓
 
+    codes = [[f"A{u}", f"A{v}", price] for u, v, price in flights]
+    print(f"Labeled result: {findCheapestPriceLabeled(codes, 'A0', 'A2', 4)}")  # Expected: 11
+
 if __name__ == '__main__':
     main()
 
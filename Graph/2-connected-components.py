@@ -1,10 +1,13 @@
+from collections import deque, defaultdict
+
+
 class Solution:
     def findNumberOfComponent(self, V, edges):
         graph = self.createGraph(V, edges)
-        visited = set()
+        visited = bytearray(V)  # Vertices are 0..V-1: 1 byte each instead of a set entry
         count = 0
         for i in range(V):
-            if i not in visited:
+            if not visited[i]:
                 self.bfs(graph, i, visited)
                 count = count + 1
         return count
@@ -12,19 +15,69 @@ class Solution:
     
     def bfs(self, graph, start, visited):
         queue = deque([start])
-        visited.add(start)
+        visited[start] = 1
         while queue:
             node = queue.popleft()
             for neighbor in graph[node]:
-                visited.add(neighbor)
-                queue.append(neighbor)
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+
+    # Set-based version kept for comparison
+    def findNumberOfComponentWithSet(self, V, edges):
+        graph = self.createGraph(V, edges)
+        visited = set()
+        count = 0
+        for i in range(V):
+            if i not in visited:
+                queue = deque([i])
+                visited.add(i)
+                while queue:
+                    node = queue.popleft()
+                    for neighbor in graph[node]:
+                        if neighbor not in visited:
+                            visited.add(neighbor)
+                            queue.append(neighbor)
+                count = count + 1
+        return count
         
     def createGraph(self, V, edges):
         graph = defaultdict(list)
         for edge in edges:
-            graph[edge[0]] = edge[1]
-            graph[edge[1]] = edge[0]
+            graph[edge[0]].append(edge[1])
+            graph[edge[1]].append(edge[0])
         return graph
+
+
+# For very large graphs: parallel_components in 3-bfs.py splits the work across
+# processes (label propagation over a shared-memory CSR) instead of one BFS at a time.
+def compareVisited(V=300_000, E=200_000, seed=0):
+    import random
+    import time
+    rng = random.Random(seed)
+    edges = [(rng.randrange(V), rng.randrange(V)) for _ in range(E)]
+    solution = Solution()
+
+    start = time.perf_counter()
+    expected = solution.findNumberOfComponentWithSet(V, edges)
+    setTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = solution.findNumberOfComponent(V, edges)
+    bytesTime = time.perf_counter() - start
+
+    print(f"V={V:,}, E={E:,}: {result} components")
+    print(f"set visited:       {setTime*1000:8.1f}ms")
+    print(f"bytearray visited: {bytesTime*1000:8.1f}ms ({setTime/bytesTime:.1f}x), same: {result == expected}")
+
+
+def main():
+    print(Solution().findNumberOfComponent(5, [[0, 1], [1, 2], [3, 4]]))  # 2
+    compareVisited()
+
+
+if __name__ == '__main__':
+    main()
        
 # Complexity Analysis
 # Time Complexity: O(V+E),Each vertex is visited exactly once, and each edge is processed at most twice (once from each end).
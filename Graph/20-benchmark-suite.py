@@ -0,0 +1,363 @@
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from math import isqrt
+from typing import Callable, Dict, List, Tuple
+
+"""
+BFS / DFS BENCHMARK SUITE
+
+compare_performance (3-bfs-practice.py) and compare_dfs_methods (4.dfs.py)
+time ONE 1000-vertex chain with ONE perf_counter call:
+    - one shape  → says nothing about hubs, grids, wide frontiers, deep trees
+    - one run    → dominated by noise (GC, CPU frequency, other processes)
+    - no memory, no history → slowdowns slip in unnoticed
+
+This suite:
+    - Seeded graph families: chain, star, grid, erdos-renyi, power-law, deep-tree
+    - Sizes 10^3 .. 10^7 vertices
+    - Warmup runs, then repeats → min + median
+    - Peak memory via tracemalloc (separate run: tracemalloc slows allocation)
+    - JSON results + baseline comparison → a slowdown beyond the tolerance
+      exits non-zero with a loud REGRESSION report
+
+Usage:
+    python 20-benchmark-suite.py                                  # quick run
+    python 20-benchmark-suite.py --sizes 1e3 1e5 1e6 --output now.json
+    python 20-benchmark-suite.py --save-baseline baseline.json   # record
+    python 20-benchmark-suite.py --baseline baseline.json        # check (exit 1 on regression)
+
+⚠️ 10^7 vertices needs several GB of RAM (dict-of-lists graphs) and minutes per family.
+"""
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_module(filename: str):
+    """Import a sibling script by file name (names like '4.dfs.py' can't be imported normally)."""
+    path = os.path.join(HERE, filename)
+    name = os.path.splitext(filename)[0].replace('-', '_').replace('.', '_')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================
+# GRAPH FAMILIES (seeded → same graph every run)
+# ============================================================
+
+def chain_graph(n: int, seed: int = 0) -> Dict[int, List[int]]:
+    """0 → 1 → ... → n-1. Depth n, frontier 1. Worst case for recursion."""
+    graph = {i: [i + 1] for i in range(n - 1)}
+    graph[n - 1] = []
+    return graph
+
+
+def star_graph(n: int, seed: int = 0) -> Dict[int, List[int]]:
+    """Hub 0 connected to everyone. Frontier n-1 after one step."""
+    graph = {0: list(range(1, n))}
+    for i in range(1, n):
+        graph[i] = [0]
+    return graph
+
+
+def grid_graph(n: int, seed: int = 0) -> Dict[int, List[int]]:
+    """√n × √n 4-connected grid. Diameter ~2√n, frontier ~√n."""
+    side = max(1, isqrt(n))
+    graph = {}
+    for r in range(side):
+        for c in range(side):
+            v = r * side + c
+            neighbors = []
+            if r > 0:
+                neighbors.append(v - side)
+            if r < side - 1:
+                neighbors.append(v + side)
+            if c > 0:
+                neighbors.append(v - 1)
+            if c < side - 1:
+                neighbors.append(v + 1)
+            graph[v] = neighbors
+    return graph
+
+
+def erdos_renyi_graph(n: int, seed: int = 0, avg_degree: int = 8) -> Dict[int, List[int]]:
+    """Uniform random undirected graph with ~n·avg_degree/2 edges. Low diameter, no hubs."""
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(n)}
+    for _ in range(n * avg_degree // 2):
+        u, v = rng.randrange(n), rng.randrange(n)
+        graph[u].append(v)
+        graph[v].append(u)
+    return graph
+
+
+def power_law_graph(n: int, seed: int = 0, m: int = 4) -> Dict[int, List[int]]:
+    """Barabási–Albert preferential attachment: few huge hubs, tiny diameter."""
+    rng = random.Random(seed)
+    graph = defaultdict(list)
+    targets = list(range(min(m, n)))
+    repeated = []  # Every edge endpoint once → sampling is degree-proportional
+    for source in range(len(targets), n):
+        for target in set(targets):
+            graph[source].append(target)
+            graph[target].append(source)
+            repeated.extend((source, target))
+        targets = [rng.choice(repeated) for _ in range(m)]
+    return {i: graph[i] for i in range(n)}
+
+
+def deep_tree_graph(n: int, seed: int = 0) -> Dict[int, List[int]]:
+    """Rooted tree, parent is i-1 or a few steps back → depth ~0.75n with short side branches."""
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(n)}
+    for child in range(1, n):
+        back = rng.randrange(1, 9) if rng.random() < 0.1 else 1  # Stay local → tree stays deep
+        graph[max(0, child - back)].append(child)
+    return graph
+
+
+FAMILIES: Dict[str, Callable[[int, int], Dict[int, List[int]]]] = {
+    'chain': chain_graph,
+    'star': star_graph,
+    'grid': grid_graph,
+    'erdos-renyi': erdos_renyi_graph,
+    'power-law': power_law_graph,
+    'deep-tree': deep_tree_graph,
+}
+
+
+# ============================================================
+# ALGORITHMS UNDER TEST
+# ============================================================
+
+def load_algorithms() -> Dict[str, Callable]:
+    """name → fn(graph, start), taken from the existing BFS/DFS files."""
+    bfs = load_module('3-bfs-practice.py')
+    dfs = load_module('4.dfs.py')
+    return {
+        'bfs_deque': bfs.bfs_with_deque,
+        'bfs_list_pop0': bfs.bfs_with_list_pop0,
+        'bfs_list_index': bfs.bfs_with_list_index,
+        'bfs_two_lists': bfs.bfs_with_two_lists,
+        'bfs_ring_buffer': bfs.bfs_with_ring_buffer,
+        'dfs_recursive': dfs.dfs_recursive,
+        'dfs_iterative': dfs.dfs_iterative,
+        'dfs_iterative_alt': dfs.dfs_iterative_alternative,
+    }
+
+
+QUADRATIC = {'bfs_list_pop0'}  # O(V²) - only run up to QUADRATIC_LIMIT
+QUADRATIC_LIMIT = 10_000
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+
+def run_one(fn: Callable, graph, start: int, warmup: int, repeats: int,
+            measure_memory: bool) -> Dict:
+    """Warmup, then `repeats` timed runs, then one tracemalloc run."""
+    try:
+        for _ in range(warmup):
+            fn(graph, start)
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            result = fn(graph, start)
+            times.append(time.perf_counter() - t0)
+    except RecursionError:
+        return {'status': 'recursion-error'}
+
+    record = {
+        'status': 'ok',
+        'min_ms': min(times) * 1000,
+        'median_ms': statistics.median(times) * 1000,
+        'visited': len(result),
+    }
+    if measure_memory:
+        tracemalloc.start()
+        fn(graph, start)
+        record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return record
+
+
+def run_suite(families: List[str], sizes: List[int], algorithms: List[str],
+              warmup: int = 1, repeats: int = 5, seed: int = 0,
+              measure_memory: bool = True) -> Dict:
+    """Run every (family, size, algorithm) and return the JSON-ready report."""
+    available = load_algorithms()
+    results = []
+
+    for family in families:
+        for n in sizes:
+            t0 = time.perf_counter()
+            graph = FAMILIES[family](n, seed)
+            build_ms = (time.perf_counter() - t0) * 1000
+            edges = sum(len(neighbors) for neighbors in graph.values())
+            print(f"\n{family} n={n:,} edges={edges:,} (built in {build_ms:.0f}ms)")
+
+            for name in algorithms:
+                if name in QUADRATIC and n > QUADRATIC_LIMIT:
+                    record = {'status': 'skipped'}
+                else:
+                    record = run_one(available[name], graph, 0, warmup, repeats, measure_memory)
+                record.update(family=family, n=n, edges=edges, algorithm=name)
+                results.append(record)
+                print(format_record(record))
+            del graph
+
+    return {
+        'meta': {
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'warmup': warmup,
+            'repeats': repeats,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def format_record(record: Dict) -> str:
+    if record['status'] != 'ok':
+        return f"  {record['algorithm']:<18} {record['status']}"
+    peak = f"{record['peak_bytes']:>14,} B" if 'peak_bytes' in record else ''
+    return (f"  {record['algorithm']:<18} min {record['min_ms']:10.2f}ms  "
+            f"median {record['median_ms']:10.2f}ms  {peak}  visited {record['visited']:,}")
+
+
+# ============================================================
+# BASELINE COMPARISON
+# ============================================================
+
+def compare_to_baseline(report: Dict, baseline: Dict, tolerance: float) -> Tuple[List[str], int, List[str]]:
+    """
+    Compare median times per (family, n, algorithm).
+
+    A run is a regression if median > baseline median × (1 + tolerance),
+    or if it used to succeed and now fails.
+
+    Returns:
+        (regression lines ([] = none),
+         number of runs actually compared against an ok baseline run,
+         baseline runs missing from this report - e.g. after changing sizes)
+    """
+    key = lambda r: (r['family'], r['n'], r['algorithm'])
+    old = {key(r): r for r in baseline['results']}
+    seen = {key(r) for r in report['results']}
+    missing = [f"{family} n={n:,} {algorithm}" for family, n, algorithm in old
+               if (family, n, algorithm) not in seen]
+    regressions = []
+    compared = 0
+
+    for record in report['results']:
+        before = old.get(key(record))
+        if before is None or before['status'] != 'ok':
+            continue
+        compared += 1
+        label = f"{record['family']} n={record['n']:,} {record['algorithm']}"
+        if record['status'] != 'ok':
+            regressions.append(f"{label}: was ok, now {record['status']}")
+            continue
+        ratio = record['median_ms'] / before['median_ms']
+        if ratio > 1 + tolerance:
+            regressions.append(f"{label}: median {before['median_ms']:.2f}ms → "
+                               f"{record['median_ms']:.2f}ms ({ratio:.2f}x)")
+    return regressions, compared, missing
+
+
+def parse_size(text: str) -> int:
+    """Accept 1000, 1_000 or 1e3."""
+    return int(float(text.replace('_', '')))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="BFS/DFS benchmark suite")
+    parser.add_argument('--families', nargs='+', default=list(FAMILIES), choices=list(FAMILIES))
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[1_000, 10_000, 100_000])
+    parser.add_argument('--algorithms', nargs='+', default=None,
+                        help="subset of algorithm names (default: all)")
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="skip tracemalloc runs")
+    parser.add_argument('--output', help="write results JSON here")
+    parser.add_argument('--baseline', help="compare against this results JSON")
+    parser.add_argument('--save-baseline', help="write results JSON as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed median slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    algorithms = args.algorithms or list(load_algorithms())
+    report = run_suite(args.families, args.sizes, algorithms, args.warmup,
+                       args.repeats, args.seed, not args.no_memory)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"\nResults written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions, compared, missing = compare_to_baseline(report, baseline, args.tolerance)
+        if missing:
+            print(f"\n{len(missing)} baseline run(s) not in this report:")
+            for line in missing:
+                print(f"  - {line}")
+        if compared == 0:
+            print(f"\nERROR: no run matched an ok run in {args.baseline} - nothing was compared "
+                  f"(different --families/--sizes/--algorithms?)")
+            return 1
+        if regressions:
+            print("\n" + "!" * 60)
+            print(f"REGRESSION: {len(regressions)} run(s) slower than baseline "
+                  f"by more than {args.tolerance:.0%}")
+            for line in regressions:
+                print(f"  ✗ {line}")
+            print("!" * 60)
+            return 1
+        print(f"\nNo regressions in {compared} compared run(s) vs {args.baseline} "
+              f"(tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+
+"""
+READING THE RESULTS:
+
+- min_ms: best case, closest to the algorithm's true cost
+- median_ms: what the baseline check uses (robust to one noisy run)
+- peak_bytes: tracemalloc peak of one run (Python allocations only)
+- recursion-error: any algorithm that still recurses, past ~1000 depth
+  (dfs_recursive now uses an explicit stack, so it no longer does)
+- skipped: list.pop(0) above 10^4 vertices (O(V²))
+
+WHAT TO EXPECT:
+
+Family       | Frontier shape        | Stresses
+-------------|-----------------------|------------------------------
+chain        | 1 vertex, depth V     | recursion depth, per-level overhead
+star         | V-1 after one step    | queue growth, one huge adjacency list
+grid         | ~√V, depth ~2√V       | steady medium frontier
+erdos-renyi  | explodes in ~log V    | random memory access
+power-law    | hubs, depth ~log V    | skewed degrees
+deep-tree    | tiny, depth ~0.75V    | DFS stack / recursion
+"""
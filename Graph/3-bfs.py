@@ -1,5 +1,8 @@
-from typing import List, Dict, Set, Deque
-from collections import deque, defaultdict
+from typing import List, Dict, Set, Deque, Iterator
+from array import array
+from collections import OrderedDict, deque, defaultdict
+from bisect import bisect_left
+from itertools import chain, islice
 
 """
 BFS (BREADTH-FIRST SEARCH) - FANG INTERVIEW GUIDE
@@ -359,6 +362,9 @@ def pattern_bidirectional_bfs(graph: Dict[int, List[int]], start: int, target: i
     Pattern: Bidirectional BFS (search from both ends).
     Time: O(V + E) but typically faster than regular BFS
     Used in: Word ladder, shortest path optimization
+
+    ⚠️ Interview sketch: answers reachability only. For exact distance,
+    path and directed graphs use bfs_bidirectional.
     """
     if start == target:
         return 0
@@ -399,6 +405,1473 @@ def expand_frontier(graph, queue, visited, other_visited):
     return False
 
 
+# ==================== LAZY (GENERATOR) BFS ====================
+#
+# The list-returning versions do ALL the work before the caller sees anything.
+# Generators hand out vertices as they are discovered:
+#   - first result after O(degree(start)) work, not O(V + E)
+#   - caller stops consuming → traversal stops; dropping the generator
+#     (or gen.close()) frees the queue and visited set
+#
+#   first_match = next((v for v in bfs_iter(graph, 0) if is_exit(v)), None)
+#   first_k = list(islice(bfs_iter(graph, 0), k))
+
+def bfs_iter(graph: Dict[int, List[int]], start: int,
+             with_depth: bool = False) -> Iterator:
+    """
+    Lazy bfs_basic: yields vertices in the same BFS order.
+
+    Time: O(V + E) if fully consumed, O(work up to the last yielded vertex) otherwise
+    Space: O(V) worst case, only while the generator is alive
+
+    Args:
+        with_depth: yield (vertex, depth) pairs instead of bare vertices
+
+    Example:
+        graph = {0: [1, 2], 1: [3], 2: [3], 3: []}
+        list(bfs_iter(graph, 0, with_depth=True)) → [(0, 0), (1, 1), (2, 1), (3, 2)]
+    """
+    if not graph or start not in graph:
+        return
+
+    visited = {start}
+    queue = deque([(start, 0)])
+
+    while queue:
+        node, depth = queue.popleft()
+        yield (node, depth) if with_depth else node
+
+        for neighbor in graph[node]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, depth + 1))
+
+
+def bfs_levels_iter(graph: Dict[int, List[int]], start: int) -> Iterator[List[int]]:
+    """
+    Lazy pattern_level_order_traversal: yields one level (list) at a time.
+
+    The next level is only built when the caller asks for it → "first level
+    containing a match" stops without touching deeper levels.
+
+    Time: O(V + E) if fully consumed
+    Space: O(V) worst case (visited + two frontiers)
+
+    Example:
+        graph = {0: [1, 2], 1: [3], 2: [3], 3: []}
+        list(bfs_levels_iter(graph, 0)) → [[0], [1, 2], [3]]
+    """
+    if not graph or start not in graph:
+        return
+
+    visited = {start}
+    level = [start]
+
+    while level:
+        yield level
+
+        next_level = []
+        for node in level:
+            for neighbor in graph[node]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    next_level.append(neighbor)
+        level = next_level
+
+
+def compare_lazy_bfs(n: int = 500_000, k: int = 10):
+    """Time-to-first-k-results: bfs_basic (eager) vs bfs_iter (lazy)."""
+    import time
+
+    graph = {i: [i + 1] if i + 1 < n else [] for i in range(n)}  # Long chain
+
+    t0 = time.perf_counter()
+    eager = bfs_basic(graph, 0)[:k]
+    eager_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    lazy = list(islice(bfs_iter(graph, 0), k))
+    lazy_time = time.perf_counter() - t0
+
+    print(f"=== First {k} BFS results (chain of {n:,}) ===")
+    print(f"bfs_basic()[:k]:        {eager_time*1000:10.3f}ms")
+    print(f"islice(bfs_iter(), k):  {lazy_time*1000:10.3f}ms  same: {eager == lazy}")
+
+
+# ==================== LARGE-GRAPH BFS ====================
+
+def power_law_graph(n: int, m: int = 4, seed: int = 0) -> Dict[int, List[int]]:
+    """
+    Undirected power-law (Barabási–Albert) graph: each new vertex links to m
+    existing vertices chosen proportionally to degree → a few huge hubs,
+    low diameter. Looks like social / web graphs. Seeded → reproducible.
+
+    Time: O(n · m), Space: O(n · m)
+    """
+    import random
+    rng = random.Random(seed)
+    graph = defaultdict(list)
+    targets = list(range(min(m, n)))  # Initial core
+    repeated = []  # Every edge endpoint once → sampling from it is degree-proportional
+    for source in range(len(targets), n):
+        for target in set(targets):
+            graph[source].append(target)
+            graph[target].append(source)
+            repeated.extend((source, target))
+        targets = [rng.choice(repeated) for _ in range(m)]
+    for vertex in range(n):
+        graph[vertex]  # Every vertex is a key
+    return graph
+
+
+def build_reverse_graph(graph: Dict[int, List[int]]) -> Dict[int, List[int]]:
+    """Incoming adjacency: reverse[v] = all u with u → v. O(V + E)."""
+    reverse = defaultdict(list)
+    for node in graph:
+        reverse[node]
+        for neighbor in graph[node]:
+            reverse[neighbor].append(node)
+    return reverse
+
+
+def bfs_bidirectional(graph: Dict[int, List[int]], start: int, target: int,
+                      reverse_graph: Dict[int, List[int]] = None,
+                      return_path: bool = False,
+                      stats: Dict[str, int] = None):
+    """
+    Level-synchronous bidirectional BFS - exact hop distance (and path).
+
+    Grows a ball from start (forward edges) and one from target (reverse edges),
+    always expanding the side whose frontier is SMALLER by one WHOLE level.
+    Two balls of radius d/2 touch far fewer vertices than one ball of radius d
+    (b^(d/2) + b^(d/2) vs b^d for branching factor b).
+
+    Why whole levels: the first edge found between the two balls is not
+    necessarily on a shortest path. Finishing the level and keeping the
+    MINIMUM dist_front[u] + 1 + dist_back[v] over all meeting edges is exact.
+
+    Time: O(V + E) worst case, typically O(b^(d/2))
+    Space: O(V)
+
+    Args:
+        reverse_graph: incoming adjacency for the backward search. Pass `graph`
+                       itself for undirected graphs; if None it is built (O(V + E)).
+        return_path: also return the path (list of vertices, [] if unreachable)
+        stats: optional dict, filled with 'vertices_visited' and 'levels_expanded'
+
+    Returns:
+        Distance (-1 if unreachable), or (distance, path) when return_path=True
+
+    Example:
+        graph = {0: [1, 2], 1: [3], 2: [3], 3: [4], 4: []}
+        bfs_bidirectional(graph, 0, 4, return_path=True) → (3, [0, 1, 3, 4])
+    """
+    def finish(distance, path, visited, levels):
+        if stats is not None:
+            stats['vertices_visited'] = visited
+            stats['levels_expanded'] = levels
+        return (distance, path) if return_path else distance
+
+    if not graph or start not in graph or target not in graph:
+        return finish(-1, [], 0, 0)
+    if start == target:
+        return finish(0, [start], 1, 0)
+    if reverse_graph is None:
+        reverse_graph = build_reverse_graph(graph)
+
+    front_parent = {start: None}  # Visited + parent in one dict
+    back_parent = {target: None}
+    front_dist = {start: 0}
+    back_dist = {target: 0}
+    front, back = [start], [target]
+    levels = 0
+
+    while front and back:
+        levels += 1
+        if len(front) <= len(back):  # Expand the smaller frontier
+            adjacency, parent, dist, other_dist = graph, front_parent, front_dist, back_dist
+            frontier, forward = front, True
+        else:
+            adjacency, parent, dist, other_dist = reverse_graph, back_parent, back_dist, front_dist
+            frontier, forward = back, False
+
+        best, meet = -1, None
+        next_frontier = []
+        for node in frontier:
+            next_dist = dist[node] + 1
+            for neighbor in adjacency[node]:
+                if neighbor in other_dist:  # Balls touch - candidate path
+                    total = next_dist + other_dist[neighbor]
+                    if best < 0 or total < best:
+                        best, meet = total, (node, neighbor)
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    dist[neighbor] = next_dist
+                    next_frontier.append(neighbor)
+
+        if forward:
+            front = next_frontier
+        else:
+            back = next_frontier
+
+        if best >= 0:  # Level finished → best is exact
+            path = []
+            if return_path:
+                u, v = meet if forward else meet[::-1]  # Edge u → v, u on start side
+                while u is not None:
+                    path.append(u)
+                    u = front_parent[u]
+                path.reverse()
+                while v is not None:
+                    path.append(v)
+                    v = back_parent[v]
+            return finish(best, path, len(front_dist) + len(back_dist), levels)
+
+    return finish(-1, [], len(front_dist) + len(back_dist), levels)
+
+
+class _CountingGraph:
+    """Adjacency wrapper counting expanded vertices (benchmark instrumentation)."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.expanded = 0
+
+    def __contains__(self, node):
+        return node in self.graph
+
+    def __len__(self):
+        return len(self.graph)
+
+    def __getitem__(self, node):
+        self.expanded += 1
+        return self.graph[node]
+
+
+def compare_bidirectional(n: int = 200_000, m: int = 4, queries: int = 20, seed: int = 0):
+    """Benchmark vertices expanded + wall time: bfs_bidirectional vs bfs_shortest_path."""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    undirected = power_law_graph(n, m, seed)
+    directed = {u: [rng.randrange(n) for _ in range(m)] for u in range(n)}  # Sparse random digraph
+    reverse = build_reverse_graph(directed)
+
+    print(f"=== Bidirectional BFS (V={n:,}, {queries} random queries) ===")
+    for name, graph, reverse_graph in (("power-law undirected", undirected, undirected),
+                                       ("random directed", directed, reverse)):
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+        counted = _CountingGraph(graph)
+        counted_reverse = counted if reverse_graph is graph else _CountingGraph(reverse_graph)
+
+        t0 = time.perf_counter()
+        expected = [bfs_shortest_path(counted, s, t) for s, t in pairs]
+        plain_time = time.perf_counter() - t0
+        plain_expanded = counted.expanded
+
+        counted.expanded = counted_reverse.expanded = 0
+        t0 = time.perf_counter()
+        results = [bfs_bidirectional(counted, s, t, counted_reverse, return_path=True) for s, t in pairs]
+        bi_time = time.perf_counter() - t0
+        bi_expanded = counted.expanded + (counted_reverse.expanded if counted_reverse is not counted else 0)
+
+        same = all(d == len(p) - 1 for (d, _), p in zip(results, expected))
+        print(f"{name}:")
+        print(f"  bfs_shortest_path:  {plain_expanded:>12,} vertices expanded, {plain_time*1000:8.1f}ms")
+        print(f"  bfs_bidirectional:  {bi_expanded:>12,} vertices expanded, {bi_time*1000:8.1f}ms "
+              f"({plain_expanded/max(bi_expanded, 1):.0f}x fewer), same distances: {same}")
+
+
+def bfs_direction_optimizing(graph: Dict[int, List[int]], start: int,
+                             reverse_graph: Dict[int, List[int]] = None,
+                             alpha: int = 14, beta: int = 24,
+                             stats: Dict[str, int] = None) -> Dict[int, int]:
+    """
+    Direction-optimizing BFS (Beamer et al.) - same output as bfs_with_levels.
+
+    TOP-DOWN step (normal BFS): every frontier vertex scans its out-edges.
+        Cost ≈ edges leaving the frontier (m_f)
+
+    BOTTOM-UP step: every UNVISITED vertex scans its in-edges and stops at the
+        FIRST parent found in the frontier.
+        Cost ≤ edges into unvisited vertices (m_u), usually far less (early break)
+
+    Switching rule:
+        top-down → bottom-up when m_f > m_u / alpha  (frontier got huge)
+        bottom-up → top-down when frontier size < V / beta  (frontier shrinking)
+
+    On low-diameter power-law graphs the middle 1-2 levels hold most vertices;
+    bottom-up skips the bulk of their edges.
+
+    Time: O(V + E) worst case, typically examines several times fewer edges
+    Space: O(V)
+
+    Args:
+        reverse_graph: incoming adjacency. Pass `graph` itself for undirected graphs;
+                       if None it is built here (O(V + E)).
+        stats: optional dict, filled with 'edges_examined' and 'bottom_up_levels'
+
+    Returns:
+        Dict vertex → distance from start (same as bfs_with_levels)
+    """
+    if not graph or start not in graph:
+        return {}
+    if reverse_graph is None:
+        reverse_graph = build_reverse_graph(graph)
+
+    levels = {start: 0}
+    frontier = [start]
+    unvisited = [v for v in reverse_graph if v != start]  # Only vertices with in-edges can be reached
+    edges_to_check = sum(len(reverse_graph[v]) for v in unvisited)  # m_u
+    vertex_count = len(unvisited) + 1
+    examined = 0
+    bottom_up_levels = 0
+    bottom_up = False
+    level = 0
+
+    while frontier:
+        frontier_edges = sum(len(graph[node]) for node in frontier)  # m_f
+        if not bottom_up and frontier_edges > edges_to_check / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < vertex_count / beta:
+            bottom_up = False
+
+        level += 1
+        next_frontier = []
+        if bottom_up:
+            bottom_up_levels += 1
+            in_frontier = set(frontier)
+            still_unvisited = []
+            for vertex in unvisited:
+                if vertex in levels:
+                    continue
+                for parent in reverse_graph[vertex]:
+                    examined += 1
+                    if parent in in_frontier:  # Found a parent - stop scanning
+                        levels[vertex] = level
+                        next_frontier.append(vertex)
+                        break
+                else:
+                    still_unvisited.append(vertex)
+            unvisited = still_unvisited
+        else:
+            for node in frontier:
+                for neighbor in graph[node]:
+                    examined += 1
+                    if neighbor not in levels:
+                        levels[neighbor] = level
+                        next_frontier.append(neighbor)
+
+        edges_to_check -= sum(len(reverse_graph[v]) for v in next_frontier)
+        frontier = next_frontier
+
+    if stats is not None:
+        stats['edges_examined'] = examined
+        stats['bottom_up_levels'] = bottom_up_levels
+    return levels
+
+
+def compare_direction_optimizing(n: int = 200_000, m: int = 8, seed: int = 0):
+    """Benchmark on a power-law graph: edges examined + wall time vs bfs_with_levels."""
+    import time
+
+    graph = power_law_graph(n, m, seed)
+    start = n - 1  # A low-degree leaf - worst case for plain top-down
+
+    t0 = time.perf_counter()
+    expected = bfs_with_levels(graph, start)
+    plain_time = time.perf_counter() - t0
+    plain_edges = sum(len(graph[v]) for v in expected)  # Top-down scans every reached edge
+
+    stats = {}
+    t0 = time.perf_counter()
+    result = bfs_direction_optimizing(graph, start, reverse_graph=graph, stats=stats)  # Undirected
+    do_time = time.perf_counter() - t0
+
+    print(f"=== Direction-optimizing BFS (power-law, V={n:,}, E≈{n*m:,}) ===")
+    print(f"top-down only:         {plain_edges:>12,} edges, {plain_time*1000:8.1f}ms")
+    print(f"direction-optimizing:  {stats['edges_examined']:>12,} edges, {do_time*1000:8.1f}ms "
+          f"({plain_edges/stats['edges_examined']:.1f}x fewer edges, "
+          f"{stats['bottom_up_levels']} bottom-up levels)")
+    print(f"Same levels: {result == expected}")
+
+
+_BIT_POSITIONS = [[bit for bit in range(8) if byte >> bit & 1] for byte in range(256)]
+
+
+def bfs_many_sources(graph: Dict[int, List[int]], sources: List[int],
+                     batch_size: int = None,
+                     stats: Dict[str, int] = None) -> List[Dict[int, int]]:
+    """
+    Bit-parallel multi-source BFS (MS-BFS) - bfs_with_levels for MANY sources at once.
+
+    Unlike bfs_multi_source (one merged distance), every source keeps its own
+    distances. Each source gets one bit; every vertex keeps bitmasks (Python ints):
+
+        seen[v]  = sources that already reached v
+        visit[v] = sources for which v is on the CURRENT frontier
+
+    One level:
+        for v in frontier: for n in graph[v]: next[n] |= visit[v]   ← ONE edge scan for all sources
+        new = next[n] & ~seen[n]  → those sources reach n at this level
+
+    When sources share most of the graph (the usual case) a vertex is expanded
+    once per level for the whole batch instead of once per source.
+
+    Time: O(D · (V + E) · S/w) worst case (D levels, S sources, w = bits per machine word)
+          vs O(S · (V + E)) for S separate BFS runs; plus O(S · V) to emit distances
+    Space: O(V · S/w) for the masks + O(S · V) output
+
+    Args:
+        sources: start vertices (row i of the result belongs to sources[i])
+        batch_size: sources per traversal (None = all in one batch; Python ints
+                    are arbitrary width, so 64 is not a hard limit)
+        stats: optional dict, filled with 'edges_scanned' and 'batches'
+
+    Returns:
+        Distance matrix as list of dicts: result[i] == bfs_with_levels(graph, sources[i])
+    """
+    result = [{} for _ in sources]
+    if not graph or not sources:
+        return result
+
+    batch_size = batch_size or len(sources)
+    scanned = 0
+    batches = 0
+
+    for lo in range(0, len(sources), batch_size):
+        batch = sources[lo:lo + batch_size]
+        rows = result[lo:lo + batch_size]  # Same dict objects, batch-local indexing
+        mask_bytes = (len(batch) + 7) // 8
+        batches += 1
+        seen = {}
+        visit = {}
+        for bit, source in enumerate(batch):
+            if source not in graph:
+                continue
+            mask = 1 << bit
+            seen[source] = seen.get(source, 0) | mask
+            visit[source] = visit.get(source, 0) | mask
+            rows[bit][source] = 0
+
+        level = 0
+        while visit:
+            level += 1
+            reached = defaultdict(int)
+            for node, mask in visit.items():  # Shared edge scan
+                scanned += len(graph[node])
+                for neighbor in graph[node]:
+                    reached[neighbor] |= mask
+
+            visit = {}
+            for node, mask in reached.items():
+                new = mask & ~seen.get(node, 0)
+                if not new:
+                    continue
+                seen[node] = seen.get(node, 0) | new
+                visit[node] = new
+                # Emit a distance per newly-arrived source bit, one byte at a time
+                for offset, byte in enumerate(new.to_bytes(mask_bytes, 'little')):
+                    if byte:
+                        for bit in _BIT_POSITIONS[byte]:
+                            rows[offset * 8 + bit][node] = level
+
+    if stats is not None:
+        stats['edges_scanned'] = scanned
+        stats['batches'] = batches
+    return result
+
+
+def compare_many_sources(n: int = 20_000, m: int = 4, source_count: int = 256, seed: int = 0):
+    """Benchmark: one MS-BFS vs source_count separate bfs_with_levels runs."""
+    import random
+    import time
+
+    graph = power_law_graph(n, m, seed)
+    sources = random.Random(seed).sample(range(n), source_count)
+    arcs = sum(map(len, graph.values()))
+
+    t0 = time.perf_counter()
+    expected = [bfs_with_levels(graph, s) for s in sources]
+    loop_time = time.perf_counter() - t0
+
+    print(f"=== Multi-source BFS (power-law, V={n:,}, {source_count} sources) ===")
+    print(f"{source_count} x bfs_with_levels:  {arcs * source_count:>12,} edges scanned, "
+          f"{loop_time*1000:8.1f}ms")
+    for batch_size in (64, None):
+        stats = {}
+        t0 = time.perf_counter()
+        result = bfs_many_sources(graph, sources, batch_size=batch_size, stats=stats)
+        ms_time = time.perf_counter() - t0
+        label = f"MS-BFS batch={batch_size or source_count}"
+        print(f"{label:<24}{stats['edges_scanned']:>12,} edges scanned, {ms_time*1000:8.1f}ms "
+              f"({loop_time/ms_time:.1f}x), same: {result == expected}")
+
+
+# ---------- Vectorized (NumPy) level-synchronous BFS ----------
+#
+# Queue BFS pays Python overhead per EDGE (`neighbor not in visited`).
+# Level-synchronous BFS keeps the whole frontier as an index array and does
+# one gather / mask / dedupe per LEVEL → per-edge work moves into C.
+#
+#   frontier   = [0]                 (int array)
+#   candidates = neighbors of ALL frontier nodes, gathered at once from CSR
+#   candidates = candidates[~visited[candidates]]     (boolean mask)
+#   frontier   = first occurrence of each candidate   (np.minimum.at, keeps FIFO order!)
+#
+# Keeping FIRST occurrences in gather order reproduces exactly the order a
+# deque BFS discovers vertices → results are identical, not just equivalent.
+
+try:
+    import numpy as np
+except ImportError:  # Optional: the *_numpy functions fall back to the deque versions
+    np = None
+
+
+class CSRArrays:
+    """
+    Graph as two NumPy arrays (Compressed Sparse Row) + label mapping.
+
+    offsets[v] .. offsets[v + 1] = slice of `neighbors` holding v's neighbors.
+    ids[i] = original label of dense vertex i (None when labels are already 0..V-1).
+
+    Build once, query many times: conversion from a dict is O(V + E) in Python,
+    each BFS after that is vectorized.
+    """
+
+    def __init__(self, offsets, neighbors, ids=None, index=None):
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.ids = ids
+        self.index = index
+        self.n = len(offsets) - 1
+
+    def to_dense(self, vertex):
+        """Original label → dense id (None if unknown)."""
+        if self.index is None:
+            return vertex if type(vertex) is int and 0 <= vertex < self.n else None
+        return self.index.get(vertex)
+
+    def to_labels(self, dense):
+        """Dense id array → list of original labels."""
+        if self.ids is None:
+            return dense.tolist()
+        ids = self.ids
+        return [ids[i] for i in dense.tolist()]
+
+
+def build_csr(graph) -> 'CSRArrays':
+    """
+    Convert an adjacency dict (or a CSRGraph from 1-representation.py) to CSRArrays.
+
+    - CSRGraph: zero-copy, np.frombuffer over its offsets/neighbors arrays
+    - Dict keyed 0..V-1: labels used directly as dense ids
+    - Anything else: labels interned to 0..V-1 (neighbor-only vertices included)
+
+    Time: O(V + E), Space: O(V + E)
+    """
+    if hasattr(graph, 'offsets') and hasattr(graph, 'neighbors'):
+        offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+        neighbors = np.frombuffer(graph.neighbors, dtype=np.int32)
+        return CSRArrays(offsets, neighbors)
+
+    n = len(graph)
+    degrees = np.fromiter(map(len, graph.values()), dtype=np.int64, count=n)
+    edge_count = int(degrees.sum())
+
+    dense_keys = all(type(v) is int and 0 <= v < n for v in graph)
+    if dense_keys:  # Keys are a permutation of 0..V-1 → walk them in id order
+        neighbors = np.fromiter(chain.from_iterable(map(graph.__getitem__, range(n))),
+                                dtype=np.int64, count=edge_count)
+        if not edge_count or (neighbors.min() >= 0 and neighbors.max() < n):
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.fromiter(map(len, map(graph.__getitem__, range(n))),
+                                  dtype=np.int64, count=n), out=offsets[1:])
+            return CSRArrays(offsets, neighbors)
+
+    ids = list(graph)
+    index = {v: i for i, v in enumerate(ids)}
+    flat = []
+    for v in ids:
+        for neighbor in graph[v]:
+            if neighbor not in index:  # Appears only as a neighbor
+                index[neighbor] = len(ids)
+                ids.append(neighbor)
+            flat.append(index[neighbor])
+    offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:n + 1])
+    offsets[n + 1:] = edge_count  # Neighbor-only vertices have no out-edges
+    return CSRArrays(offsets, np.array(flat, dtype=np.int64), ids, index)
+
+
+def _bfs_frontier_numpy(csr: 'CSRArrays', sources):
+    """
+    Level-synchronous BFS over CSR arrays.
+
+    Returns (order, dist): dense ids in BFS visit order + their distances.
+
+    Time: O(V + E) element work, O(D) Python iterations (D = number of levels)
+    Space: O(V + E)
+    """
+    offsets, neighbors = csr.offsets, csr.neighbors
+    visited = np.zeros(csr.n, dtype=bool)
+    unseen = np.iinfo(np.int64).max
+    first_seen = np.full(csr.n, unseen, dtype=np.int64)
+    frontier = np.asarray(sources, dtype=np.int64)
+    visited[frontier] = True
+    levels = [frontier]
+    level_sizes = [len(frontier)]
+
+    while len(frontier):
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            break
+        # Gather every neighbor slice at once:
+        # position of k-th gathered element = starts[owner] + (k - first k of owner)
+        shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        candidates = neighbors[shift + np.arange(total)]
+        candidates = candidates[~visited[candidates]]
+        if not len(candidates):
+            break
+        # Keep FIRST occurrence of each vertex (= FIFO order): scatter-min positions
+        positions = np.arange(len(candidates))
+        np.minimum.at(first_seen, candidates, positions)
+        frontier = candidates[first_seen[candidates] == positions].astype(np.int64, copy=False)
+        first_seen[frontier] = unseen  # Reset only what we touched
+        visited[frontier] = True
+        levels.append(frontier)
+        level_sizes.append(len(frontier))
+
+    order = np.concatenate(levels)
+    dist = np.repeat(np.arange(len(levels), dtype=np.int64), level_sizes)
+    return order, dist
+
+
+def bfs_basic_numpy(graph, start, csr: 'CSRArrays' = None) -> List[int]:
+    """
+    Vectorized bfs_basic: same visit order.
+
+    Pass a prebuilt `csr` (build_csr(graph)) when running many queries.
+    Falls back to bfs_basic when NumPy is missing.
+    """
+    if np is None:
+        return bfs_basic(graph, start)
+    if not graph or start not in graph:
+        return []
+    csr = csr if csr is not None else build_csr(graph)
+    order, _ = _bfs_frontier_numpy(csr, [csr.to_dense(start)])
+    return csr.to_labels(order)
+
+
+def bfs_with_levels_numpy(graph, start, csr: 'CSRArrays' = None) -> Dict[int, int]:
+    """Vectorized bfs_with_levels: same vertex → distance dict (same insertion order too)."""
+    if np is None:
+        return bfs_with_levels(graph, start)
+    if not graph or start not in graph:
+        return {}
+    csr = csr if csr is not None else build_csr(graph)
+    order, dist = _bfs_frontier_numpy(csr, [csr.to_dense(start)])
+    return dict(zip(csr.to_labels(order), dist.tolist()))
+
+
+def bfs_multi_source_numpy(graph, sources: List[int], csr: 'CSRArrays' = None) -> Dict[int, int]:
+    """Vectorized bfs_multi_source: every source starts at distance 0."""
+    if np is None:
+        return bfs_multi_source(graph, sources)
+    if not graph or not sources:
+        return {}
+    csr = csr if csr is not None else build_csr(graph)
+    dense = list(dict.fromkeys(csr.to_dense(s) for s in sources if s in graph))  # Dedupe, keep order
+    if not dense:
+        return {}
+    order, dist = _bfs_frontier_numpy(csr, dense)
+    return dict(zip(csr.to_labels(order), dist.tolist()))
+
+
+def compare_numpy_bfs(n: int = 1_250_000, m: int = 4, seed: int = 0):
+    """Benchmark deque BFS vs vectorized BFS on a power-law graph (≈ 2·n·m directed arcs)."""
+    import time
+
+    if np is None:
+        print("NumPy not installed - skipping vectorized BFS benchmark")
+        return
+
+    graph = power_law_graph(n, m, seed)
+    arcs = sum(map(len, graph.values()))
+
+    t0 = time.perf_counter()
+    csr = build_csr(graph)
+    build_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    expected = bfs_with_levels(graph, 0)
+    deque_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    order, dist = _bfs_frontier_numpy(csr, [0])
+    array_time = time.perf_counter() - t0
+    result = dict(zip(csr.to_labels(order), dist.tolist()))
+
+    print(f"=== Vectorized BFS (power-law, V={n:,}, arcs={arcs:,}) ===")
+    print(f"build_csr (once):          {build_time*1000:8.1f}ms")
+    print(f"bfs_with_levels (deque):   {deque_time*1000:8.1f}ms  "
+          f"({arcs/deque_time/1e6:.1f}M edges/s)")
+    print(f"frontier BFS (arrays):     {array_time*1000:8.1f}ms  "
+          f"({arcs/array_time/1e6:.1f}M edges/s, {deque_time/array_time:.1f}x)")
+    print(f"Same result: {result == expected}")
+
+
+# ---------- Dense-ID fast path: reusable array state ----------
+#
+# When vertices are 0..V-1, visited/distance don't need hashing:
+#   visited  → bytearray stamp (1 byte per vertex, small-int reads)
+#   distance → array('i')      (4 bytes per vertex vs ~100 for a dict entry)
+#
+# Generation counter: stamp[v] == generation ⟺ v visited in THIS query.
+# New query = generation += 1 → O(1) reset instead of O(V) clearing.
+# A byte holds 255 generations; then one memset-speed clear.
+
+class BFSWorkspace:
+    """
+    Reusable visited/distance state for repeated BFS queries on dense IDs 0..V-1.
+
+    Allocate once per graph, pass to every query - no per-query set/dict.
+    Results of the LAST query stay readable until the next one starts.
+
+    Generation rule (same in 3-bfs.py, 14.shortest-path-bfs.py and
+    DFSWorkspace in 4.dfs.py): stamp[v] == generation ⟺ v seen in the
+    current query; generations run 1..255, then one clear and back to 1.
+
+    Space: 5 bytes per vertex
+    """
+
+    def __init__(self, V: int):
+        self.V = V
+        self.stamp = bytearray(V)
+        self.dist = array('i', bytes(4 * V))
+        self.generation = 0
+        self._zeros = bytes(V)
+
+    def next_generation(self) -> int:
+        """Start a new query: O(1) except one clear every 255 queries."""
+        if self.generation == 255:
+            self.stamp[:] = self._zeros
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def visited(self, v: int) -> bool:
+        return self.stamp[v] == self.generation
+
+    def distance(self, v: int) -> int:
+        """Distance found by the last query, -1 if v was not reached."""
+        return self.dist[v] if self.stamp[v] == self.generation else -1
+
+    @classmethod
+    def for_graph(cls, V: int, workspace = None) -> 'BFSWorkspace':
+        """A fresh workspace for V vertices, or the given one if it is big enough."""
+        if workspace is None:
+            return cls(V)
+        if workspace.V < V:
+            raise ValueError(f"workspace holds {workspace.V} vertices, graph needs V={V}")
+        return workspace
+
+
+def out_of_range(V: int, error: LookupError) -> ValueError:
+    """Dense paths index stamp/dist/graph directly - turn a bad id into a clear error."""
+    return ValueError(f"dense BFS/DFS needs every vertex id in 0..{V - 1} with a row in graph "
+                      f"(pass V = max id + 1): {error!r}")
+
+
+def bfs_dense(graph, sources: List[int], workspace: BFSWorkspace,
+              target: int = None) -> List[int]:
+    """
+    BFS core on dense IDs with workspace state (multi-source capable).
+
+    graph: anything indexable by 0..V-1 → neighbors (list of lists, dict, CSRGraph)
+           where V = workspace.V; an id outside that range raises ValueError
+
+    Distances land in workspace.dist (read via workspace.distance).
+    With target: stops as soon as target is discovered.
+
+    Time: O(V + E) per query, O(1) reset
+    Space: O(V) for the returned visit order; state is reused
+
+    Returns:
+        Vertices in BFS visit order (the queue itself)
+    """
+    generation = workspace.next_generation()
+    stamp, dist = workspace.stamp, workspace.dist
+
+    queue = []
+    try:  # Free in 3.11+ until something raises
+        for source in sources:
+            if stamp[source] != generation:
+                stamp[source] = generation
+                dist[source] = 0
+                queue.append(source)
+        if target is not None and stamp[target] == generation:
+            return queue
+
+        for node in queue:  # The list IS the queue: iteration sees appended items
+            next_dist = dist[node] + 1
+            for neighbor in graph[node]:
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                    dist[neighbor] = next_dist
+                    queue.append(neighbor)
+                    if neighbor == target:
+                        return queue
+    except LookupError as error:
+        raise out_of_range(workspace.V, error) from error
+
+    return queue
+
+
+def bfs_basic_dense(graph, start: int, V: int, workspace: BFSWorkspace = None) -> List[int]:
+    """
+    bfs_basic for dense IDs 0..V-1 - same visit order, array state.
+
+    V is explicit (like findShortestPathDense in 14.shortest-path-bfs.py):
+    len(graph) undercounts when a vertex only appears as a neighbor.
+    """
+    if not graph or not 0 <= start < V:
+        return []
+    workspace = BFSWorkspace.for_graph(V, workspace)
+    return bfs_dense(graph, [start], workspace)
+
+
+def bfs_with_levels_dense(graph, start: int, V: int, workspace: BFSWorkspace = None) -> Dict[int, int]:
+    """bfs_with_levels for dense IDs 0..V-1 - same dict, array state during the search."""
+    if not graph or not 0 <= start < V:
+        return {}
+    workspace = BFSWorkspace.for_graph(V, workspace)
+    order = bfs_dense(graph, [start], workspace)
+    dist = workspace.dist
+    return {node: dist[node] for node in order}
+
+
+def compare_dense_state(n: int = 200_000, m: int = 4, queries: int = 10, seed: int = 0):
+    """Benchmark repeated queries: set/dict state vs reused BFSWorkspace (time + peak memory)."""
+    import random
+    import time
+    import tracemalloc
+
+    graph = power_law_graph(n, m, seed)
+    starts = random.Random(seed).sample(range(n), queries)
+    workspace = BFSWorkspace(n)
+
+    def measure(fn):
+        best = float('inf')
+        for _ in range(3):  # Best of 3 - shared machines are noisy
+            t0 = time.perf_counter()
+            results = [fn(s) for s in starts]
+            best = min(best, (time.perf_counter() - t0) / queries * 1000)
+        tracemalloc.start()  # Separate run: tracemalloc slows allocation-heavy code
+        fn(starts[0])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return results, best, peak
+
+    rows = [
+        ("bfs_basic (set)", bfs_basic, None),
+        ("bfs_basic_dense", lambda s: bfs_basic_dense(graph, s, n, workspace), "bfs_basic (set)"),
+        ("bfs_with_levels (dict)", bfs_with_levels, None),
+        ("bfs_with_levels_dense", lambda s: bfs_with_levels_dense(graph, s, n, workspace), "bfs_with_levels (dict)"),
+        ("bfs_dense (array dist)", lambda s: bfs_dense(graph, [s], workspace), "bfs_with_levels (dict)"),
+    ]
+    print(f"=== Dense-ID state (power-law, V={n:,}, {queries} queries) ===")
+    print(f"{'method':<24}{'per query':>12}{'peak alloc':>14}")
+    seen = {}
+    for name, fn, baseline in rows:
+        call = fn if baseline else (lambda s, fn=fn: fn(graph, s))
+        results, ms, peak = measure(call)
+        seen[name] = (results, ms)
+        note = ""
+        if baseline:
+            base_results, base_ms = seen[baseline]
+            same = results == base_results if name != "bfs_dense (array dist)" else \
+                [len(r) for r in results] == [len(r) for r in base_results]
+            note = f"  {base_ms/ms:.1f}x, same: {same}"
+        print(f"{name:<24}{ms:>10.1f}ms{peak:>12,} B{note}")
+    print(f"Workspace: {workspace.V * 5:,} bytes allocated once, reused by every query")
+
+# ---------- Cached BFS trees for hot sources ----------
+#
+# One BFS from `source` answers EVERY (source, target) query: keep its
+# parent/level arrays and later queries just walk parents, O(path length).
+#
+#   query(s, t):  cached tree for s?  hit  → walk parent[] from t back to s
+#                                     miss → BFS once, store, evict LRU if over budget
+
+class _DynamicGraphView:
+    """
+    Read-only graph[u] / u in graph view over a DynamicGraph's `adj` rows
+    (u → {v: weight}), so BFSQueryCache can traverse it. `version` is
+    forwarded, so the cache still notices mutations made elsewhere.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    @property
+    def version(self):
+        return self.source.version
+
+    def __contains__(self, u) -> bool:
+        return u in self.source.adj
+
+    def __getitem__(self, u) -> List[int]:
+        return list(self.source.adj[u])
+
+    def __iter__(self):
+        return iter(list(self.source.adj))
+
+    def __len__(self) -> int:
+        return len(self.source.adj)
+
+
+class BFSQueryCache:
+    """
+    Shortest-hop query object with an LRU of per-source BFS trees.
+
+    Vertices are interned once to 0..V-1 (skipped when they already are);
+    each cached source costs two array('i') of length V (parent, level) = 8·V bytes. Trees are kept in
+    an OrderedDict in LRU order and evicted when the total exceeds max_bytes.
+
+    Mutate through add_edge/remove_edge (or call invalidate() after editing
+    the graph yourself) → every cached tree is dropped. Graphs exposing a
+    `version` counter (e.g. DynamicGraph) are checked automatically.
+
+    Accepted graphs:
+        - dict of lists: queries + add_edge/remove_edge
+        - DynamicGraph (1-representation.py): read through its `adj` rows,
+          mutations go through its addEdge/removeEdge
+        - any other read-only mapping (CSRGraph, ...): queries only -
+          add_edge/remove_edge raise TypeError instead of editing a copy
+
+    Time: miss O(V + E), hit O(path length) for paths, O(1) for distances
+    Space: O(V) for interning + 8·V bytes per cached source, ≤ max_bytes
+    """
+
+    def __init__(self, graph: Dict[int, List[int]], max_bytes: int = 64 * 1024 * 1024):
+        if not hasattr(graph, '__getitem__') and hasattr(graph, 'adj'):
+            graph = _DynamicGraphView(graph)  # DynamicGraph: neighbor API, no graph[u]
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._trees = OrderedDict()  # source → (parent, level), oldest first
+        self._bytes = 0
+        self._ids = None  # dense id → vertex
+        self._index = None  # vertex → dense id (None = vertices already 0..V-1)
+        self._adj = None  # adjacency over dense ids
+        self._version = getattr(graph, 'version', None)
+
+    # ----- cache management -----
+
+    def invalidate(self):
+        """Drop every cached tree (call after mutating the graph directly)."""
+        self._trees.clear()
+        self._bytes = 0
+        self._ids = self._index = self._adj = None
+        self.invalidations += 1
+
+    def _check_mutable(self, u: int):
+        """graph[u] must be the stored list itself - CSRGraph etc. hand out copies."""
+        if not isinstance(self.graph, dict) or (u in self.graph and not isinstance(self.graph[u], list)):
+            raise TypeError(f"{type(self.graph).__name__} is read-only here: mutate it through its own "
+                            f"API, then call invalidate()")
+
+    def _mutated(self):
+        self.invalidate()
+        self._version = getattr(self.graph, 'version', None)  # Already invalidated for this change
+
+    def add_edge(self, u: int, v: int):
+        """Add u → v to the wrapped graph and invalidate."""
+        if isinstance(self.graph, _DynamicGraphView):
+            self.graph.source.addEdge(u, v)
+        else:
+            self._check_mutable(u)
+            if u in self.graph:
+                self.graph[u].append(v)
+            else:
+                self.graph[u] = [v]
+            if v not in self.graph:
+                self.graph[v] = []
+        self._mutated()
+
+    def remove_edge(self, u: int, v: int) -> bool:
+        """Remove one u → v edge; invalidates only if something was removed."""
+        if isinstance(self.graph, _DynamicGraphView):
+            if not self.graph.source.removeEdge(u, v):
+                return False
+        else:
+            self._check_mutable(u)
+            if u not in self.graph or v not in self.graph[u]:
+                return False
+            self.graph[u].remove(v)
+        self._mutated()
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'cached_sources': len(self._trees),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+    def _intern(self):
+        """Dense ids 0..V-1 + adjacency over them (the graph itself if already dense)."""
+        graph = self.graph
+        n = len(graph)
+        if all(type(v) is int and 0 <= v < n for v in graph) and \
+                all(type(u) is int and 0 <= u < n for v in graph for u in graph[v]):
+            self._ids, self._index, self._adj = range(n), None, graph  # Already dense: no copy
+            return
+        ids = list(graph)
+        index = {v: i for i, v in enumerate(ids)}
+        for v in list(ids):
+            for neighbor in graph[v]:
+                if neighbor not in index:  # Appears only as a neighbor
+                    index[neighbor] = len(ids)
+                    ids.append(neighbor)
+        adj = [[index[u] for u in graph[v]] if v in graph else [] for v in ids]
+        self._ids, self._index, self._adj = ids, index, adj
+
+    def _slot(self, vertex: int) -> int:
+        return vertex if self._index is None else self._index[vertex]
+
+    def _tree(self, source: int):
+        """(parent, level) arrays for source - from cache or one BFS."""
+        version = getattr(self.graph, 'version', None)
+        if version != self._version:  # Graph changed behind our back
+            self._version = version
+            self.invalidate()
+
+        tree = self._trees.get(source)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(source)  # Most recently used
+            return tree
+
+        self.misses += 1
+        if self._ids is None:
+            self._intern()
+        adj, size_v = self._adj, len(self._ids)
+
+        start = self._slot(source)
+        parent = array('i', [-1]) * size_v  # -1 = not reached
+        level = array('i', [-1]) * size_v
+        parent[start] = start
+        level[start] = 0
+        queue = [start]
+        for node in queue:  # Same FIFO order as bfs_shortest_path → same parents
+            next_level = level[node] + 1
+            for slot in adj[node]:
+                if parent[slot] < 0:
+                    parent[slot] = node
+                    level[slot] = next_level
+                    queue.append(slot)
+
+        tree = (parent, level)
+        size = 8 * size_v
+        if size > self.max_bytes:  # Never fits - answer without caching
+            return tree
+        self._trees[source] = tree
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            self._trees.popitem(last=False)  # Least recently used
+            self._bytes -= size
+            self.evictions += 1
+        return tree
+
+    # ----- queries -----
+
+    def distance(self, source: int, target: int) -> int:
+        """Hop distance, -1 if unreachable or unknown vertex."""
+        if source not in self.graph or target not in self.graph:
+            return -1
+        _, level = self._tree(source)
+        return level[self._slot(target)]
+
+    def shortest_path(self, source: int, target: int) -> List[int]:
+        """Same result as bfs_shortest_path(graph, source, target)."""
+        if not self.graph or source not in self.graph or target not in self.graph:
+            return []
+        if source == target:
+            return [source]
+        parent, _ = self._tree(source)
+        node = self._slot(target)
+        if parent[node] < 0:
+            return []
+        ids = self._ids
+        path = [target]
+        while parent[node] != node:  # Walk back to source: O(path length)
+            node = parent[node]
+            path.append(ids[node])
+        return path[::-1]
+
+
+def compare_query_cache(n: int = 50_000, m: int = 4, hot_sources: int = 8,
+                        queries: int = 300, seed: int = 0):
+    """Repeated shortest-path queries from a few hot sources: plain BFS vs BFSQueryCache."""
+    import random
+    import time
+
+    graph = power_law_graph(n, m, seed)
+    rng = random.Random(seed)
+    sources = rng.sample(range(n), hot_sources)
+    pairs = [(rng.choice(sources), rng.randrange(n)) for _ in range(queries)]
+
+    t0 = time.perf_counter()
+    expected = [bfs_shortest_path(graph, s, t) for s, t in pairs]
+    plain_time = time.perf_counter() - t0
+
+    cache = BFSQueryCache(graph, max_bytes=8 * n * hot_sources)  # Budget sized for the hot set
+    t0 = time.perf_counter()
+    result = [cache.shortest_path(s, t) for s, t in pairs]
+    cached_time = time.perf_counter() - t0
+
+    stats = cache.stats()
+    print(f"=== BFS query cache (power-law, V={n:,}, {queries} queries, {hot_sources} hot sources) ===")
+    print(f"bfs_shortest_path each time: {plain_time*1000:9.1f}ms")
+    print(f"BFSQueryCache:               {cached_time*1000:9.1f}ms ({plain_time/cached_time:.1f}x), "
+          f"same paths: {result == expected}")
+    print(f"hits={stats['hits']} misses={stats['misses']} evictions={stats['evictions']} "
+          f"hit_rate={stats['hit_rate']:.0%} bytes={stats['bytes']:,}/{stats['max_bytes']:,}")
+
+
+# ---------- Parallel connected components (shared-memory CSR) ----------
+#
+# bfs_all_components is inherently serial: one queue, one core.
+# Label propagation with pointer jumping (Shiloach–Vishkin style) is not:
+#
+#   label[v] = v                                   (every vertex its own component)
+#   repeat until no label changes:
+#       label[v] = min(label[label[v]],            pointer jump - shortcut chains
+#                      label[u] for u in nbrs(v))  hook to the smallest neighbor label
+#
+# Fixpoint: label constant along every edge → one label (the min vertex id) per
+# component. Every round is a pure per-vertex map → split vertices into ranges
+# and give each range to a worker process. The CSR and the label array live
+# in ONE multiprocessing.shared_memory block: workers attach by name, nothing
+# is pickled per round except (lo, hi). Each worker WRITES only its own range
+# (no lost updates); reading a neighbor's stale label just costs another round.
+
+_shared_components = {}  # Worker-side cache: shm name → (shm, offsets, neighbors, labels)
+
+
+def _attach_components(name: str, V: int, E: int):
+    """Worker side: map the shared CSR + labels into this process (once per graph)."""
+    from multiprocessing import shared_memory
+    if name in _shared_components:
+        return _shared_components[name]
+    for stale in list(_shared_components):  # A long-lived pool moved on to a new graph
+        old = _shared_components.pop(stale)
+        del old  # Views first, then the mapping can close
+    shm = shared_memory.SharedMemory(name=name)
+    _shared_components[name] = (shm,) + _component_views(shm.buf, V, E)
+    return _shared_components[name]
+
+
+def _component_views(buf, V: int, E: int):
+    """offsets int64[V+1] | neighbors int32[E] (padded to 8) | labels int32[V]."""
+    neighbors_at = 8 * (V + 1)
+    labels_at = neighbors_at + 4 * E + (4 * E) % 8
+    if np is not None:
+        offsets = np.frombuffer(buf, dtype=np.int64, count=V + 1, offset=0)
+        neighbors = np.frombuffer(buf, dtype=np.int32, count=E, offset=neighbors_at)
+        labels = np.frombuffer(buf, dtype=np.int32, count=V, offset=labels_at)
+    else:
+        view = memoryview(buf)
+        offsets = view[:neighbors_at].cast('q')
+        neighbors = view[neighbors_at:neighbors_at + 4 * E].cast('i')
+        labels = view[labels_at:labels_at + 4 * V].cast('i')
+    return offsets, neighbors, labels
+
+
+def _propagate_range(task) -> int:
+    """
+    Worker: one hook + jump pass over vertices [lo, hi). Returns #labels lowered.
+    Module-level so ProcessPoolExecutor can pickle it by name.
+    """
+    name, V, E, lo, hi = task
+    _, offsets, neighbors, labels = _attach_components(name, V, E)
+    if lo >= hi:
+        return 0
+
+    if np is not None:  # Vectorized: gather + segmented min (reduceat)
+        bounds = offsets[lo:hi + 1]
+        current = labels[lo:hi].copy()
+        best = np.minimum(current, labels[current])  # Pointer jump
+        first, last = int(bounds[0]), int(bounds[-1])
+        if last > first:
+            gathered = labels[neighbors[first:last]]
+            has_edges = bounds[1:] > bounds[:-1]
+            starts = (bounds[:-1] - first)[has_edges]
+            best[has_edges] = np.minimum(best[has_edges], np.minimum.reduceat(gathered, starts))
+        lowered = best < current
+        changed = int(np.count_nonzero(lowered))
+        if changed:
+            labels[lo:hi] = best
+        return changed
+
+    changed = 0
+    for v in range(lo, hi):
+        current = labels[v]
+        best = labels[current]  # Pointer jump
+        for i in range(offsets[v], offsets[v + 1]):
+            label = labels[neighbors[i]]
+            if label < best:
+                best = label
+        if best < current:
+            labels[v] = best
+            changed += 1
+    return changed
+
+
+def parallel_components(graph: Dict[int, List[int]], workers: int = 4,
+                        return_labels: bool = False, pool=None, stats: Dict = None):
+    """
+    Connected components of an UNDIRECTED graph across a process pool.
+
+    Same components as bfs_all_components; components are ordered by their
+    first vertex in graph order and vertices inside follow graph order
+    (not BFS order).
+
+    Algorithm: label propagation + pointer jumping over a shared-memory CSR,
+    vertex ranges balanced by edge count, rounds until no label changes.
+    Uses NumPy inside workers when available, pure Python otherwise.
+
+    Time: O((V + E) · R / workers), R = rounds (≤ diameter, usually far fewer)
+    Space: O(V + E) shared once + O(V) per worker for vectorized temporaries
+
+    Args:
+        workers: processes (1 = run in this process, no pool)
+        return_labels: return (ids, labels) - labels[i] = smallest dense id in
+                       ids[i]'s component - instead of component lists
+        pool: reuse an existing ProcessPoolExecutor
+        stats: optional dict, filled with 'rounds' and 'workers'
+
+    Returns:
+        List of components, or (ids, labels) with return_labels=True
+    """
+    from multiprocessing import shared_memory
+
+    if not graph:
+        return ([], []) if return_labels else []
+
+    # Dense ids + CSR (neighbor-only vertices become ids too)
+    if np is not None:
+        csr = build_csr(graph)  # Vectorized when keys are already 0..V-1
+        ids = csr.ids if csr.ids is not None else range(csr.n)
+        offsets = csr.offsets.astype(np.int64, copy=False)
+        neighbors = csr.neighbors.astype(np.int32, copy=False)
+    else:
+        ids = list(graph)
+        index = {v: i for i, v in enumerate(ids)}
+        neighbors = array('i')
+        for v in list(ids):
+            for neighbor in graph[v]:
+                if neighbor not in index:
+                    index[neighbor] = len(ids)
+                    ids.append(neighbor)
+                neighbors.append(index[neighbor])
+        offsets = array('q', [0]) * (len(ids) + 1)
+        for v in range(len(ids)):
+            offsets[v + 1] = offsets[v] + (len(graph[ids[v]]) if v < len(graph) else 0)
+    V, E = len(ids), len(neighbors)
+
+    neighbors_at = 8 * (V + 1)
+    labels_at = neighbors_at + 4 * E + (4 * E) % 8
+    shm = shared_memory.SharedMemory(create=True, size=labels_at + 4 * V)
+    try:
+        shm.buf[:neighbors_at] = offsets.tobytes()
+        shm.buf[neighbors_at:neighbors_at + 4 * E] = neighbors.tobytes()
+        shm.buf[labels_at:labels_at + 4 * V] = array('i', range(V)).tobytes()
+        del neighbors
+
+        # Ranges with ~equal (edges + vertices): cost up to v = offsets[v] + v
+        chunks = max(1, workers * 4)
+        cuts = [bisect_left(range(V + 1), k * (E + V) / chunks, key=lambda v: offsets[v] + v)
+                for k in range(1, chunks)]
+        bounds = sorted(set([0] + cuts + [V]))
+        ranges = list(zip(bounds, bounds[1:]))
+        tasks = [(shm.name, V, E, lo, hi) for lo, hi in ranges]
+        # Owner's views; processes forked after this inherit them (no re-attach)
+        _shared_components[shm.name] = (shm,) + _component_views(shm.buf, V, E)
+
+        rounds = 0
+        own_pool = None
+        if workers > 1 and pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = own_pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            while True:
+                rounds += 1
+                if workers > 1:
+                    changed = sum(pool.map(_propagate_range, tasks))
+                else:
+                    changed = sum(map(_propagate_range, tasks))
+                if not changed:
+                    break
+        finally:
+            if own_pool is not None:
+                own_pool.shutdown()
+
+        labels = _shared_components[shm.name][3].tolist()
+    finally:
+        cached = _shared_components.pop(shm.name, None)
+        del cached  # Drop views before closing the mapping
+        shm.close()
+        shm.unlink()
+
+    if stats is not None:
+        stats['rounds'] = rounds
+        stats['workers'] = workers
+    if return_labels:
+        return list(ids), labels
+
+    groups = {}
+    for vertex, label in zip(ids, labels):
+        groups.setdefault(label, []).append(vertex)
+    return list(groups.values())
+
+
+def compare_parallel_components(n: int = 200_000, m: int = 4, worker_counts=(1, 2, 4, 8), seed: int = 0):
+    """
+    Benchmark bfs_all_components vs parallel_components on a random sparse graph.
+
+    Small enough for a dict of lists. Any win over bfs_all_components at this
+    size with 1 worker comes from the vectorized NumPy rounds, not from
+    parallelism - compare_parallel_components_large measures worker scaling.
+    """
+    import os
+    import random
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    rng = random.Random(seed)
+    graph = {v: [] for v in range(n)}
+    for _ in range(n * m // 2):  # ~n·m arcs, many components near the threshold
+        u, v = rng.randrange(n), rng.randrange(n)
+        graph[u].append(v)
+        graph[v].append(u)
+    arcs = n * m // 2 * 2
+
+    t0 = time.perf_counter()
+    expected = bfs_all_components(graph)
+    serial_time = time.perf_counter() - t0
+    expected_sets = sorted(map(sorted, expected))
+
+    print(f"=== Parallel components (V={n:,}, arcs={arcs:,}, {os.cpu_count()} CPUs, "
+          f"{'NumPy' if np is not None else 'pure Python'} workers) ===")
+    print(f"bfs_all_components:      {serial_time*1000:9.1f}ms  ({len(expected):,} components)")
+    for workers in worker_counts:
+        stats = {}
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(abs, range(workers)))  # Warm up worker processes
+                t0 = time.perf_counter()
+                result = parallel_components(graph, workers, pool=pool, stats=stats)
+                elapsed = time.perf_counter() - t0
+        else:
+            t0 = time.perf_counter()
+            result = parallel_components(graph, 1, stats=stats)
+            elapsed = time.perf_counter() - t0
+        same = sorted(map(sorted, result)) == expected_sets
+        print(f"parallel, {workers} worker(s):   {elapsed*1000:9.1f}ms  "
+              f"({serial_time/elapsed:.2f}x, {stats['rounds']} rounds) same: {same}")
+
+
+def random_csr_arrays(n: int, edges: int, seed: int = 0) -> 'CSRArrays':
+    """
+    Random undirected graph built straight into NumPy CSR (both arc directions).
+
+    For sizes a dict of lists can't hold: 50M edges = 100M arcs ≈ 0.4 GB of
+    int32 neighbors, vs ~10 GB as Python lists of ints.
+
+    Time: O(E log E) (one argsort), Space: O(E) - peak ~24 bytes per edge
+    """
+    rng = np.random.default_rng(seed)
+    src = rng.integers(0, n, size=edges, dtype=np.int32)
+    dst = rng.integers(0, n, size=edges, dtype=np.int32)
+    src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+    neighbors = dst[np.argsort(src, kind='stable')]
+    del dst
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+    return CSRArrays(offsets, neighbors)
+
+
+def compare_parallel_components_large(edges: int = 50_000_000, degree: int = 8,
+                                      worker_counts=(1, 2, 4, 8), seed: int = 0):
+    """
+    parallel_components at the size it was built for: speedup vs worker count.
+
+    The graph is generated as CSRArrays (parallel_components takes it
+    zero-copy); bfs_all_components can't run here - the dict alone would
+    need ~10 GB - so the baseline is the 1-worker run. Labels are checked
+    to be a fixpoint: equal along every edge, labels[labels] == labels.
+
+    ⚠️ Speedup needs real cores: with fewer CPUs than workers the extra
+    processes just time-share. Measured on a 1-CPU box (NumPy workers,
+    12.5M vertices, 50M edges, 7 rounds, ~2.3 GB peak RSS):
+        1 worker 22.7s, 2 → 23.2s (0.98x), 4 → 23.4s (0.97x), 8 → 20.8s (1.10x)
+    i.e. NO parallel speedup here - near-linear scaling to 8 cores is
+    unverified until this runs on an 8-core machine.
+    Run it: python 3-bfs.py --parallel-large
+    """
+    import os
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    if np is None:
+        print("compare_parallel_components_large needs NumPy - skipped")
+        return
+    n = 2 * edges // degree
+    t0 = time.perf_counter()
+    csr = random_csr_arrays(n, edges, seed)
+    build_time = time.perf_counter() - t0
+    src = np.repeat(np.arange(n, dtype=np.int32), np.diff(csr.offsets))
+
+    cpus = os.cpu_count()
+    print(f"=== Parallel components, large (V={n:,}, edges={edges:,}, {cpus} CPUs) ===")
+    print(f"build CSR:               {build_time*1000:9.1f}ms")
+    base = None
+    for workers in worker_counts:
+        stats = {}
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(abs, range(workers)))  # Warm up worker processes
+                t0 = time.perf_counter()
+                _, labels = parallel_components(csr, workers, return_labels=True, pool=pool, stats=stats)
+                elapsed = time.perf_counter() - t0
+        else:
+            t0 = time.perf_counter()
+            _, labels = parallel_components(csr, 1, return_labels=True, stats=stats)
+            elapsed = time.perf_counter() - t0
+        labels = np.array(labels, dtype=np.int32)
+        valid = bool((labels[src] == labels[csr.neighbors]).all() and (labels[labels] == labels).all())
+        base = base or elapsed
+        note = "  ⚠️ more workers than CPUs" if workers > (cpus or 1) else ""
+        print(f"parallel, {workers} worker(s):   {elapsed*1000:9.1f}ms  speedup {base/elapsed:.2f}x "
+              f"(efficiency {base/elapsed/workers:.0%}, {stats['rounds']} rounds) valid: {valid}{note}")
+        del labels
+
+
 # ==================== EDGE CASES TO ALWAYS CONSIDER ====================
 
 """
@@ -475,6 +1948,9 @@ def run_tests():
     components = bfs_all_components(disconnected)
     print(f"Components: {components}")
     # Expected: [[0, 1], [2, 3], [4]]
+    print(f"Parallel (2 workers): {parallel_components(disconnected, workers=2)}")
+    print(f"Label array: {parallel_components(disconnected, workers=1, return_labels=True)}")
+    # Expected: [[0, 1], [2, 3], [4]], ([0, 1, 2, 3, 4], [0, 0, 2, 2, 4])
 
     print("\n=== Matrix BFS ===")
     matrix = [
@@ -496,9 +1972,75 @@ def run_tests():
     print(f"Nodes by level: {levels_grouped}")
     # Expected: [[0], [1, 2], [3, 4, 5]]
 
+    print("\n=== Lazy BFS (generators) ===")
+    print(f"First 3 with depth: {list(islice(bfs_iter(graph, 0, with_depth=True), 3))}")
+    first_leaf_level = next(level for level in bfs_levels_iter(graph, 0) if 3 in level)
+    print(f"First level containing 3: {first_leaf_level}")
+    # Expected: [(0, 0), (1, 1), (2, 1)], [3, 4, 5]
+
+    print("\n=== Bidirectional BFS ===")
+    print(f"Distance 3→5: {bfs_bidirectional(graph, 3, 5, graph)}")
+    print(f"Distance + path 3→5: {bfs_bidirectional(graph, 3, 5, graph, return_path=True)}")
+    # Expected: 4, (4, [3, 1, 0, 2, 5])
+
+    print("\n=== Direction-Optimizing BFS ===")
+    stats = {}
+    print(f"Distances from 0: {bfs_direction_optimizing(graph, 0, graph, alpha=1, stats=stats)}")
+    print(f"Stats: {stats}")
+    # Expected: same distances as bfs_with_levels
+
+    print("\n=== Many-Source BFS (bit-parallel) ===")
+    for source, row in zip([0, 3, 5], bfs_many_sources(graph, [0, 3, 5])):
+        print(f"Distances from {source}: {row}")
+    # Expected: each row == bfs_with_levels(graph, source)
+
+    print("\n=== Dense-ID BFS (reusable workspace) ===")
+    workspace = BFSWorkspace(len(graph))
+    print(f"BFS from 0: {bfs_basic_dense(graph, 0, len(graph), workspace)}")
+    print(f"Distances from 5: {bfs_with_levels_dense(graph, 5, len(graph), workspace)}")
+    bfs_dense(graph, [3], workspace, target=5)
+    print(f"Distance 3→5 (early stop): {workspace.distance(5)}")
+    # Expected: [0, 1, 2, 3, 4, 5], {5: 0, 2: 1, 0: 2, 1: 3, 3: 4, 4: 4}, 4
+
+    print("\n=== BFS Query Cache ===")
+    cache = BFSQueryCache({node: list(neighbors) for node, neighbors in graph.items()})
+    print(f"Path 3→5: {cache.shortest_path(3, 5)}, distance 3→4: {cache.distance(3, 4)}")
+    cache.add_edge(3, 5)
+    cache.add_edge(5, 3)
+    print(f"After adding 3↔5: path 3→5: {cache.shortest_path(3, 5)}")
+    print(f"Stats: {cache.stats()}")
+    # Expected: [3, 1, 0, 2, 5], 2, then [3, 5]; 1 hit, 2 misses, 2 invalidations
+
+    print("\n=== Vectorized (NumPy) BFS ===")
+    print(f"BFS from 0: {bfs_basic_numpy(graph, 0)}")
+    print(f"Distances from 0: {bfs_with_levels_numpy(graph, 0)}")
+    print(f"Min distances from {0, 5}: {bfs_multi_source_numpy(graph, [0, 5])}")
+    # Expected: same as the deque versions above
+
+    print()
+    compare_lazy_bfs()
+    print()
+    compare_bidirectional(n=50_000, queries=10)
+    print()
+    compare_direction_optimizing(n=50_000)
+    print()
+    compare_many_sources(n=5_000, source_count=128)
+    print()
+    compare_dense_state(n=50_000)
+    print()
+    compare_query_cache(n=20_000, queries=100)
+    print()
+    compare_parallel_components(n=100_000, worker_counts=(1, 2))
+    print()
+    compare_numpy_bfs(n=250_000)
+
 
 if __name__ == "__main__":
-    run_tests()
+    import sys
+    if "--parallel-large" in sys.argv:  # 50M edges: ~3 GB of RAM, minutes per worker count
+        compare_parallel_components_large()
+    else:
+        run_tests()
 
 
 """
@@ -510,9 +2052,15 @@ Basic BFS               | O(V + E)  | O(V)      | Traversal, reachability
 BFS with Levels         | O(V + E)  | O(V)      | Shortest path, min steps
 Shortest Path           | O(V + E)  | O(V)      | Find actual path
 All Components          | O(V + E)  | O(V)      | Connectivity
+Parallel Components     | O(R(V+E)/P)| O(V + E) | Connectivity, many cores
 Matrix BFS              | O(R � C)  | O(R � C)  | Grid problems
 Multi-Source BFS        | O(V + E)  | O(V)      | Multiple starting points
-Bidirectional BFS       | O(V + E)* | O(V)      | Faster shortest path
+Bidirectional BFS       | O(V + E)* | O(V)      | Faster shortest path (distance + path)
+Direction-Optimizing    | O(V + E)  | O(V)      | Low-diameter huge graphs
+Many-Source (MS-BFS)    | O(D(V+E)S/w)| O(VS/w) | Per-source distances, S sources
+Dense BFS + workspace   | O(V + E)  | O(V) reused| Many queries, IDs 0..V-1
+BFSQueryCache (hit)     | O(path)   | 8V/source | Hot-source shortest paths
+NumPy Frontier BFS      | O(V + E)  | O(V + E)  | Millions of edges, reused CSR
 
 *Bidirectional BFS has same worst case but typically 2x faster in practice
 
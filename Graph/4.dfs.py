@@ -1,5 +1,6 @@
-from typing import List, Dict, Set
-from collections import defaultdict
+from typing import List, Dict, Set, Iterator, Tuple
+from array import array
+from collections import defaultdict, deque
 
 """
 DFS (DEPTH-FIRST SEARCH) - FANG INTERVIEW GUIDE
@@ -36,6 +37,90 @@ WHEN TO USE DFS vs BFS:
 KEY DIFFERENCE: DFS goes DEEP, BFS goes WIDE
 """
 
+# ============================================================
+# DFS EVENTS: Explicit Stack + Hooks (no recursion anywhere)
+# ============================================================
+
+# NOT a shared engine for the routines below. dfs_recursive, both cycle
+# detectors, dfs_topological_sort and dfs_connected_components each inline
+# the same explicit-stack loop instead: one generator switch per event made
+# them 0.5-0.7x of recursion, inlined they sit at ~0.9-1.05x (see
+# compare_recursion_free). Only dfs_recursive_with_path and count_paths_dag
+# run on dfs_events. Use it when you need the hooks, not for plain traversal.
+
+PRE, POST, BACK, CROSS = 'pre', 'post', 'back', 'cross'
+
+
+def dfs_events(graph: Dict[int, List[int]], roots, events=(PRE, POST)) -> Iterator[Tuple[str, int, int]]:
+    """
+    Recursion-free DFS that reports what a recursive DFS would do, as events.
+
+    Each stack frame is (node, iterator over graph[node]) - the iterator
+    remembers which neighbor comes next, exactly like the `for` loop inside
+    a suspended recursive call. Same visiting order as recursive DFS.
+
+        stack = [(0, iter([1, 2]))]
+        top frame yields 1 (unvisited) → PRE 1, push (1, iter(graph[1]))
+        top frame exhausted            → POST, pop
+
+    Events (kind, node, other):
+        (PRE,   v, parent)   v discovered (parent None for a root)
+        (POST,  v, parent)   all of v's descendants finished
+        (BACK,  v, w)        edge v → w, w still on the DFS path (gray)
+        (CROSS, v, w)        edge v → w, w already finished (black)
+
+    Only kinds listed in `events` are yielded - every yield costs a
+    generator switch, so ask for what the caller needs.
+
+    Depth is limited only by memory (no sys.setrecursionlimit needed).
+    Stop consuming at any time - nothing else is explored.
+
+    Time: O(V + E)
+    Space: O(V) - one frame per vertex on the current path + state
+
+    Args:
+        roots: start vertices, tried in order (already-visited roots skipped)
+        events: event kinds to emit (default PRE and POST)
+    """
+    want_pre, want_post = PRE in events, POST in events
+    want_back, want_cross = BACK in events, CROSS in events
+    want_edges = want_back or want_cross
+
+    on_path = {}  # vertex → True while on the DFS path, False once finished
+    state_of = on_path.get
+
+    for root in roots:
+        if root in on_path:
+            continue
+        on_path[root] = True
+        if want_pre:
+            yield PRE, root, None
+        stack = [(root, iter(graph[root]))]
+        push, pop = stack.append, stack.pop
+
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:  # Resume where this frame left off
+                state = state_of(neighbor)
+                if state is None:  # Tree edge: "recursive call"
+                    on_path[neighbor] = True
+                    if want_pre:
+                        yield PRE, neighbor, node
+                    push((neighbor, iter(graph[neighbor])))
+                    break
+                if want_edges:
+                    if state:
+                        if want_back:
+                            yield BACK, node, neighbor
+                    elif want_cross:
+                        yield CROSS, node, neighbor
+            else:  # Frame exhausted: "return"
+                pop()
+                on_path[node] = False
+                if want_post:
+                    yield POST, node, stack[-1][0] if stack else None
+
+
 # ============================================================
 # METHOD 1: Recursive DFS (Most Common in Interviews!)
 # ============================================================
@@ -50,11 +135,22 @@ def dfs_recursive(graph: Dict[int, List[int]], start: int) -> List[int]:
 
     Space Complexity: O(V)
         - visited set: O(V)
-        - Call stack: O(H) where H is graph height/depth
+        - Stack (call or explicit): O(H) where H is graph height/depth
         - Worst case (linear chain): O(V)
         - Best case (balanced tree): O(log V)
 
-    ✅ CLEANEST and MOST COMMON in interviews!
+    ✅ CLEANEST and MOST COMMON in interviews! The interview version:
+
+        def dfs_helper(node):
+            visited.add(node)
+            result.append(node)
+            for neighbor in graph[node]:
+                if neighbor not in visited:
+                    dfs_helper(neighbor)
+
+    Here the call stack is an explicit stack of neighbor iterators (the
+    same frames as dfs_events, inlined - no event per vertex): same order,
+    and a 10^7-deep chain works.
 
     Example:
         graph = {0: [1, 2], 1: [3], 2: [4], 3: [], 4: []}
@@ -63,29 +159,29 @@ def dfs_recursive(graph: Dict[int, List[int]], start: int) -> List[int]:
     if not graph or start not in graph:
         return []
 
-    visited = set()
-    result = []
-
-    def dfs_helper(node: int):
-        """Helper function for recursion."""
-        visited.add(node)  # Mark as visited
-        result.append(node)
+    visited = {start}
+    result = [start]
+    stack = [iter(graph[start])]
 
-        # Explore all neighbors
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                dfs_helper(neighbor)  # Recursive call
+    while stack:
+        for neighbor in stack[-1]:  # Resume the top frame's neighbor loop
+            if neighbor not in visited:  # "Recursive call"
+                visited.add(neighbor)
+                result.append(neighbor)
+                stack.append(iter(graph[neighbor]))
+                break
+        else:  # "Return"
+            stack.pop()
 
-    dfs_helper(start)
     return result
 
 
 def dfs_recursive_with_path(graph: Dict[int, List[int]], start: int, target: int) -> List[int]:
     """
-    Recursive DFS that finds a path from start to target.
+    DFS that finds a path from start to target (the DFS-tree path).
 
     Time: O(V + E) - worst case explores entire graph
-    Space: O(V) - visited + call stack
+    Space: O(V) - parent map + explicit stack
 
     Returns:
         Path from start to target, or [] if no path exists
@@ -93,24 +189,17 @@ def dfs_recursive_with_path(graph: Dict[int, List[int]], start: int, target: int
     if not graph or start not in graph or target not in graph:
         return []
 
-    visited = set()
-
-    def dfs_path_helper(node: int, path: List[int]) -> List[int]:
-        """Helper that returns path if target found."""
-        if node == target:
-            return path + [node]
-
-        visited.add(node)
+    parent = {}
+    for _, node, came_from in dfs_events(graph, [start], (PRE,)):
+        parent[node] = came_from
+        if node == target:  # Walk tree edges back to start
+            path = []
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            return path[::-1]
 
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                result = dfs_path_helper(neighbor, path + [node])
-                if result:  # Path found!
-                    return result
-
-        return []  # No path found from this branch
-
-    return dfs_path_helper(start, [])
+    return []  # No path found
 
 
 # ============================================================
@@ -143,6 +232,9 @@ def dfs_iterative(graph: Dict[int, List[int]], start: int) -> List[int]:
     Example:
         graph = {0: [1, 2], 1: [3], 2: [4], 3: [], 4: []}
         dfs_iterative(graph, 0) → [0, 2, 4, 1, 3] (different from recursive!)
+
+    Asking ancestor/subtree questions afterwards? Use dfs_intervals - same
+    order, plus tin/tout labels for O(1) answers.
     """
     if not graph or start not in graph:
         return []
@@ -198,6 +290,258 @@ def dfs_iterative_alternative(graph: Dict[int, List[int]], start: int) -> List[i
     return result
 
 
+def dfs_iter(graph: Dict[int, List[int]], start: int,
+             with_depth: bool = False) -> Iterator:
+    """
+    Lazy dfs_iterative: yields vertices in the same order, as they are visited.
+
+    Stop consuming at any point (break, next(), islice) and the traversal
+    stops too - no wasted work exploring the rest of a huge graph.
+
+    Time: O(V + E) if fully consumed
+    Space: O(V) while the generator is alive
+
+    Args:
+        with_depth: yield (vertex, depth) pairs; depth = depth in the DFS tree
+
+    Example:
+        graph = {0: [1, 2], 1: [3], 2: [4], 3: [], 4: []}
+        list(dfs_iter(graph, 0)) → [0, 1, 3, 2, 4]
+        next(v for v in dfs_iter(graph, 0) if v > 2) → 3
+    """
+    if not graph or start not in graph:
+        return
+
+    visited = set()
+    stack = [(start, 0)]
+
+    while stack:
+        node, depth = stack.pop()
+
+        if node in visited:
+            continue
+
+        visited.add(node)
+        yield (node, depth) if with_depth else node
+
+        for neighbor in reversed(graph[node]):
+            if neighbor not in visited:
+                stack.append((neighbor, depth + 1))
+
+
+# ============================================================
+# METHOD 2b: Dense-ID Fast Path (array state, reusable)
+# ============================================================
+
+class DFSWorkspace:
+    """
+    Reusable visited state for repeated DFS queries on dense IDs 0..V-1.
+
+    BFSWorkspace from 3-bfs.py without the dist array (DFS needs no
+    distances) - keep the rest identical.
+
+    Generation rule (same in 3-bfs.py, 14.shortest-path-bfs.py and
+    DFSWorkspace in 4.dfs.py): stamp[v] == generation ⟺ v seen in the
+    current query; generations run 1..255, then one clear and back to 1.
+
+    Space: 1 byte per vertex (vs ~50+ bytes per set entry)
+    """
+
+    def __init__(self, V: int):
+        self.V = V
+        self.stamp = bytearray(V)
+        self.generation = 0
+        self._zeros = bytes(V)
+
+    def next_generation(self) -> int:
+        """Start a new query: O(1) except one clear every 255 queries."""
+        if self.generation == 255:
+            self.stamp[:] = self._zeros
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def visited(self, v: int) -> bool:
+        return self.stamp[v] == self.generation
+
+    @classmethod
+    def for_graph(cls, V: int, workspace = None) -> 'DFSWorkspace':
+        """A fresh workspace for V vertices, or the given one if it is big enough."""
+        if workspace is None:
+            return cls(V)
+        if workspace.V < V:
+            raise ValueError(f"workspace holds {workspace.V} vertices, graph needs V={V}")
+        return workspace
+
+
+def out_of_range(V: int, error: LookupError) -> ValueError:
+    """Dense paths index stamp/dist/graph directly - turn a bad id into a clear error."""
+    return ValueError(f"dense BFS/DFS needs every vertex id in 0..{V - 1} with a row in graph "
+                      f"(pass V = max id + 1): {error!r}")
+
+
+def dfs_iterative_dense(graph, start: int, V: int, workspace: DFSWorkspace = None) -> List[int]:
+    """
+    dfs_iterative for dense IDs 0..V-1 - same order, bytearray visited.
+
+    graph: anything indexable by 0..V-1 (list of lists, dict, CSRGraph)
+    V is explicit (like findShortestPathDense in 14.shortest-path-bfs.py):
+    len(graph) undercounts when a vertex only appears as a neighbor.
+    An id outside 0..V-1, or a vertex with no row, raises ValueError.
+
+    Time: O(V + E), O(1) reset between queries
+    Space: O(V) stack + result, visited state reused
+    """
+    if not graph or not 0 <= start < V:
+        return []
+
+    workspace = DFSWorkspace.for_graph(V, workspace)
+    generation = workspace.next_generation()
+    stamp = workspace.stamp
+    stack = [start]
+    result = []
+
+    try:  # Free in 3.11+ until something raises
+        while stack:
+            node = stack.pop()
+
+            if stamp[node] == generation:
+                continue
+
+            stamp[node] = generation
+            result.append(node)
+
+            for neighbor in reversed(graph[node]):
+                if stamp[neighbor] != generation:
+                    stack.append(neighbor)
+    except LookupError as error:
+        raise out_of_range(V, error) from error
+
+    return result
+
+
+def dfs_connected_components_dense(graph) -> List[List[int]]:
+    """
+    dfs_connected_components for dense IDs: one bytearray, no recursion.
+
+    Single pass over all vertices → no workspace/generations needed.
+    Same components and order as dfs_connected_components when the dict
+    keys are 0..V-1 in order.
+
+    Time: O(V + E)
+    Space: O(V) - 1 byte per vertex visited state
+    """
+    if not graph:
+        return []
+
+    visited = bytearray(len(graph))
+    components = []
+
+    for root in range(len(graph)):
+        if visited[root]:
+            continue
+        component = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if visited[node]:
+                continue
+            visited[node] = 1
+            component.append(node)
+            for neighbor in reversed(graph[node]):
+                if not visited[neighbor]:
+                    stack.append(neighbor)
+        components.append(component)
+
+    return components
+
+
+class DFSIntervals:
+    """
+    DFS-tree interval labels from ONE traversal (see dfs_intervals).
+
+        tin[v]  = position of v in preorder (-1 if not reached)
+        tout[v] = tin[v] + size of v's subtree   (exclusive end)
+        order   = preorder (same as dfs_iterative)
+        post    = post-order (children before parent)
+
+    A subtree is a contiguous run of the preorder, so:
+        u ancestor of v  ⟺  tin[u] <= tin[v] < tout[u]     (2 comparisons)
+        subtree(u)       =  order[tin[u]:tout[u]]           (a slice)
+
+    Space: 4 array('i') → 16 bytes per vertex
+    """
+
+    def __init__(self, tin: array, tout: array, order: array, post: array):
+        self.tin = tin
+        self.tout = tout
+        self.order = order
+        self.post = post
+
+    def is_ancestor(self, u: int, v: int) -> bool:
+        """True if u is v or an ancestor of v in the DFS tree. O(1)."""
+        return self.tin[u] <= self.tin[v] < self.tout[u]
+
+    def subtree(self, u: int) -> array:
+        """u and all its DFS-tree descendants, in preorder. O(size) copy, no traversal."""
+        return self.order[self.tin[u]:self.tout[u]]
+
+    def subtree_size(self, u: int) -> int:
+        return self.tout[u] - self.tin[u]
+
+
+def dfs_intervals(graph, start: int) -> DFSIntervals:
+    """
+    dfs_iterative from start, but also records entry/exit labels, so later
+    "is u an ancestor of v?" / "what is under u?" need no new traversal.
+
+    Same visiting order as dfs_iterative (= recursive DFS). Uses
+    (node, neighbor iterator) frames, so exit time is known exactly
+    when a frame runs out of neighbors: tout[node] = len(order).
+
+    graph: dense IDs 0..V-1 (list of lists, dict, CSRGraph)
+
+    Time: O(V + E) once, then O(1) per ancestor query
+    Space: O(V) - 1-byte visited + four int arrays
+
+    Example:
+        graph = {0: [1, 2], 1: [3], 2: [4], 3: [], 4: []}
+        labels = dfs_intervals(graph, 0)
+        list(labels.order) → [0, 1, 3, 2, 4]
+        labels.is_ancestor(1, 3) → True, labels.is_ancestor(1, 4) → False
+        list(labels.subtree(2)) → [2, 4]
+    """
+    V = len(graph)
+    tin = array('i', [-1]) * V
+    tout = array('i', [-1]) * V
+    order = array('i')
+    post = array('i')
+    if not 0 <= start < V:
+        return DFSIntervals(tin, tout, order, post)
+
+    visited = bytearray(V)
+    visited[start] = 1
+    tin[start] = 0
+    order.append(start)
+    stack = [(start, iter(graph[start]))]
+
+    while stack:
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if not visited[neighbor]:  # Enter
+                visited[neighbor] = 1
+                tin[neighbor] = len(order)
+                order.append(neighbor)
+                stack.append((neighbor, iter(graph[neighbor])))
+                break
+        else:  # Exit: everything under node is already in order
+            stack.pop()
+            tout[node] = len(order)
+            post.append(node)
+
+    return DFSIntervals(tin, tout, order, post)
+
+
 # ============================================================
 # METHOD 3: DFS for Specific Use Cases
 # ============================================================
@@ -211,6 +555,9 @@ def dfs_all_paths(graph: Dict[int, List[int]], start: int, target: int) -> List[
         - Exponential in nature
 
     Space: O(V) for recursion depth
+        + O(P × V) for the result - P paths can be exponential!
+        ⚠️ For big graphs use dfs_all_paths_iter (lazy, limits, pruning)
+           or count_paths_dag (count only, O(V + E) on a DAG)
 
     Common in: Path finding, combination problems
     """
@@ -242,6 +589,114 @@ def dfs_all_paths(graph: Dict[int, List[int]], start: int, target: int) -> List[
     return all_paths
 
 
+def dfs_all_paths_iter(graph: Dict[int, List[int]], start: int, target: int,
+                       max_paths: int = None, max_depth: int = None) -> Iterator[List[int]]:
+    """
+    Lazy dfs_all_paths: yields each start → target path as it is found.
+
+    Same paths in the same order, but memory is O(V) for the search state -
+    only the caller decides how many paths to keep.
+
+    Pruning: one reverse BFS from target gives dist_to_target[v] (edges
+    from v to target). Vertices missing from it can't reach target → never
+    entered, so dead-end regions cost nothing after the BFS. With max_depth,
+    a vertex is also skipped when depth + dist_to_target > max_depth.
+
+    Time: O(V + E) setup + O(V!) worst case for the paths themselves
+    Space: O(V) - path, on-path set, one neighbor iterator per path vertex
+
+    Args:
+        max_paths: stop after this many paths
+        max_depth: only paths with at most this many edges
+    """
+    if not graph or start not in graph or target not in graph:
+        return
+
+    reverse = defaultdict(list)
+    for node, neighbors in graph.items():
+        for neighbor in neighbors:
+            reverse[neighbor].append(node)
+    dist_to_target = {target: 0}
+    queue = deque([target])
+    while queue:
+        node = queue.popleft()
+        for prev in reverse[node]:
+            if prev not in dist_to_target:
+                dist_to_target[prev] = dist_to_target[node] + 1
+                queue.append(prev)
+
+    limit = float('inf') if max_depth is None else max_depth
+    if start not in dist_to_target or dist_to_target[start] > limit or max_paths == 0:
+        return
+
+    found = 0
+    path = [start]
+    on_path = {start}
+    if start == target:
+        yield [start]
+        return
+    stack = [iter(graph[start])]
+
+    while stack:
+        depth = len(path)  # Edges used after stepping to a neighbor
+        for neighbor in stack[-1]:
+            if neighbor in on_path:
+                continue
+            remaining = dist_to_target.get(neighbor)
+            if remaining is None or depth + remaining > limit:
+                continue  # Can't reach target, or can't within max_depth
+            if neighbor == target:
+                path.append(neighbor)
+                yield path.copy()
+                path.pop()
+                found += 1
+                if found == max_paths:
+                    return
+                continue
+            path.append(neighbor)
+            on_path.add(neighbor)
+            stack.append(iter(graph.get(neighbor, ())))
+            break
+        else:  # BACKTRACK
+            stack.pop()
+            on_path.discard(path.pop())
+
+
+def count_paths_dag(graph: Dict[int, List[int]], start: int, target: int) -> int:
+    """
+    Number of start → target paths on a DAG, without listing them.
+
+    Topological DP: ways[v] = paths from v to target
+        ways[target] = 1
+        ways[v] = Σ ways[w] for v → w
+    Post-order (dfs_events POST) finishes every successor before v, so each
+    vertex and edge is handled once. Python ints don't overflow - the
+    exact count even when it has hundreds of digits.
+
+    Raises ValueError if a cycle is reachable from start (count could be
+    infinite - use dfs_all_paths_iter for simple paths instead).
+
+    Time: O(V + E)
+    Space: O(V)
+
+    Example:
+        count_paths_dag({0: [1, 2], 1: [3], 2: [3], 3: []}, 0, 3) → 2
+    """
+    if not graph or start not in graph or target not in graph:
+        return 0
+
+    ways = {}
+    for kind, node, other in dfs_events(graph, [start], (POST, BACK)):
+        if kind is BACK:
+            raise ValueError(f"cycle through {other} - count_paths_dag needs a DAG")
+        if node == target:
+            ways[node] = 1  # Paths stop at target, like dfs_all_paths
+        else:
+            ways[node] = sum(ways[neighbor] for neighbor in graph[node])
+
+    return ways[start]
+
+
 def dfs_cycle_detection_directed(graph: Dict[int, List[int]]) -> bool:
     """
     Detect cycle in DIRECTED graph using DFS.
@@ -263,27 +718,29 @@ def dfs_cycle_detection_directed(graph: Dict[int, List[int]]) -> bool:
         return False
 
     visited = set()
-    rec_stack = set()  # Nodes in current recursion path
-
-    def has_cycle(node: int) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
-
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                if has_cycle(neighbor):
-                    return True
-            elif neighbor in rec_stack:  # Back edge found!
-                return True
-
-        rec_stack.remove(node)  # Remove from recursion stack
-        return False
+    rec_stack = set()  # Nodes on the current DFS path
 
-    # Check each component
-    for node in graph:
-        if node not in visited:
-            if has_cycle(node):
-                return True
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        rec_stack.add(root)
+        nodes = [root]
+        stack = [iter(graph[root])]
+
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    rec_stack.add(neighbor)
+                    nodes.append(neighbor)
+                    stack.append(iter(graph[neighbor]))
+                    break
+                if neighbor in rec_stack:
+                    return True  # Back edge = cycle
+            else:
+                stack.pop()
+                rec_stack.remove(nodes.pop())  # Backtrack
 
     return False
 
@@ -308,23 +765,29 @@ def dfs_cycle_detection_undirected(graph: Dict[int, List[int]]) -> bool:
 
     visited = set()
 
-    def has_cycle(node: int, parent: int) -> bool:
-        visited.add(node)
-
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                if has_cycle(neighbor, node):
-                    return True
-            elif neighbor != parent:  # Visited and not parent = cycle!
-                return True
-
-        return False
-
-    # Check each component
-    for node in graph:
-        if node not in visited:
-            if has_cycle(node, -1):
-                return True
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        nodes = [root]
+        parents = [None]
+        stack = [iter(graph[root])]
+
+        while stack:
+            parent = parents[-1]
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    parents.append(nodes[-1])
+                    nodes.append(neighbor)
+                    stack.append(iter(graph[neighbor]))
+                    break
+                if neighbor != parent:
+                    return True  # Visited and not parent = cycle!
+            else:
+                stack.pop()
+                nodes.pop()
+                parents.pop()
 
     return False
 
@@ -348,24 +811,27 @@ def dfs_topological_sort(graph: Dict[int, List[int]], n: int) -> List[int]:
         Topological order: [0, 2, 1, 3] or [0, 1, 2, 3]
     """
     visited = set()
-    stack = []  # Store topological order
-
-    def dfs_topo(node: int):
-        visited.add(node)
+    order = []
 
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                dfs_topo(neighbor)
-
-        # Add to stack AFTER exploring all descendants
-        stack.append(node)
+    for root in range(n):
+        if root in visited or root not in graph:
+            continue
+        visited.add(root)
+        nodes = [root]
+        stack = [iter(graph[root])]
 
-    # Process all nodes
-    for node in range(n):
-        if node not in visited and node in graph:
-            dfs_topo(node)
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    nodes.append(neighbor)
+                    stack.append(iter(graph[neighbor]))
+                    break
+            else:
+                stack.pop()
+                order.append(nodes.pop())  # Add node AFTER exploring all descendants
 
-    return stack[::-1]  # Reverse for topological order
+    return order[::-1]  # Reverse for topological order
 
 
 def dfs_connected_components(graph: Dict[int, List[int]]) -> List[List[int]]:
@@ -383,21 +849,134 @@ def dfs_connected_components(graph: Dict[int, List[int]]) -> List[List[int]]:
     visited = set()
     components = []
 
-    def dfs_component(node: int, component: List[int]):
-        visited.add(node)
-        component.append(node)
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        component = [root]
+        stack = [iter(graph[root])]
+
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    component.append(neighbor)
+                    stack.append(iter(graph[neighbor]))
+                    break
+            else:
+                stack.pop()
+        components.append(component)
 
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                dfs_component(neighbor, component)
+    return components
 
-    for node in graph:
-        if node not in visited:
-            component = []
-            dfs_component(node, component)
-            components.append(component)
 
-    return components
+def dfs_biconnected(graph: Dict[int, List[int]]) -> Tuple[List[int], List[Tuple[int, int]], List[List[int]]]:
+    """
+    Articulation points, bridges and biconnected components of an
+    UNDIRECTED graph - one iterative Tarjan low-link pass.
+
+    Instead of "delete each vertex, recount components" (O(V × (V + E))):
+        disc[v] = DFS discovery time
+        low[v]  = smallest disc reachable from v's subtree using ONE back edge
+    For tree edge parent → child, after child finishes:
+        low[child] >= disc[parent] → parent separates child's subtree
+                                     (articulation point, unless parent is a
+                                     root - roots need 2+ DFS children)
+        low[child] >  disc[parent] → edge parent-child is a bridge
+    Edges are pushed on an edge stack as they are explored; when
+    low[child] >= disc[parent], the edges down to (parent, child) form one
+    biconnected component.
+
+    The parent edge is skipped ONCE, not by vertex: with parallel edges
+    u-v, u-v the second copy is a back edge, so u-v is not a bridge.
+    Self-loops are ignored.
+
+    Explicit stack of (node, neighbor iterator) frames → millions of
+    vertices without touching the recursion limit.
+
+    Time: O(V + E)
+    Space: O(V + E) - disc/low + edge stack
+
+    Returns:
+        (articulation points in discovery order,
+         bridges as (parent, child) tree edges,
+         biconnected components as vertex lists - an isolated vertex is
+         its own component)
+
+    Example:
+        0 - 1 - 2        articulation points: [1]
+            |  /         bridges: [(0, 1)]
+            3            components: [[1, 2, 3], [0, 1]]
+    """
+    disc = {}
+    low = {}
+    cut = set()
+    bridges = []
+    components = []
+    edge_stack = []
+    timer = 0
+    skipped = object()  # Marks "parent edge already skipped" in parents
+
+    for root in graph:
+        if root in disc:
+            continue
+        disc[root] = low[root] = timer
+        timer += 1
+        root_children = 0
+        stack = [(root, iter(graph[root]))]
+        parents = [None]
+
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor == parents[-1]:
+                    parents[-1] = skipped  # Skip the tree edge back to parent once
+                    continue
+                seen = disc.get(neighbor)
+                if seen is None:  # Tree edge
+                    disc[neighbor] = low[neighbor] = timer
+                    timer += 1
+                    edge_stack.append((node, neighbor))
+                    stack.append((neighbor, iter(graph[neighbor])))
+                    parents.append(node)
+                    break
+                if seen < disc[node]:  # Back edge to an ancestor (self-loop: equal → ignored)
+                    edge_stack.append((node, neighbor))
+                    if seen < low[node]:
+                        low[node] = seen
+                # seen > disc[node]: same back edge seen from the ancestor side
+            else:
+                stack.pop()
+                parents.pop()
+                if not stack:
+                    break
+                parent = stack[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+                if low[node] >= disc[parent]:
+                    if low[node] > disc[parent]:
+                        bridges.append((parent, node))
+                    if parent == root:
+                        root_children += 1
+                    else:
+                        cut.add(parent)
+                    popped = []
+                    while True:
+                        edge = edge_stack.pop()
+                        popped.append(edge)
+                        if edge == (parent, node):
+                            break
+                    members = {}  # Ordered set, vertices in exploration order
+                    for u, v in reversed(popped):
+                        members[u] = members[v] = None
+                    components.append(list(members))
+
+        if root_children >= 2:
+            cut.add(root)
+        elif root_children == 0:  # No edges (or only self-loops)
+            components.append([root])
+
+    return [v for v in disc if v in cut], bridges, components
 
 
 # ============================================================
@@ -495,13 +1074,19 @@ STACK OVERFLOW:
 Python recursive DFS can fail on deep graphs!
 
     graph = {i: [i+1] for i in range(10000)}  # Linear chain
-    dfs_recursive(graph, 0)  # RecursionError!
+    dfs(0)  # Textbook recursive version → RecursionError!
 
 Solution:
     1. Use iterative DFS (no recursion limit!)
     2. Increase limit: sys.setrecursionlimit(10000)
        ⚠️  Risky - can crash Python interpreter
     3. Restructure algorithm if possible
+
+    ✅ In this file: every routine (dfs_recursive, cycle detection,
+       topological sort, components) uses an explicit stack of neighbor
+       iterators - inlined in the hot routines, exposed as events by
+       dfs_events for custom hooks. A 10^7-deep chain is fine; only
+       memory limits depth (see compare_recursion_free).
 """
 
 # ============================================================
@@ -509,7 +1094,12 @@ Solution:
 # ============================================================
 
 def compare_dfs_methods():
-    """Compare recursive vs iterative DFS performance."""
+    """
+    Compare recursive vs iterative DFS performance.
+
+    Single run on one chain - for graph families, repeats and baseline
+    tracking use 20-benchmark-suite.py.
+    """
     import time
 
     # Build test graph
@@ -522,11 +1112,11 @@ def compare_dfs_methods():
 
     print("=== DFS PERFORMANCE COMPARISON (1000 vertices) ===\n")
 
-    # Recursive DFS
+    # Recursive-order DFS (explicit stack, so a 1000-chain is safe)
     start = time.perf_counter()
     result1 = dfs_recursive(graph, 0)
     time1 = time.perf_counter() - start
-    print(f"1. Recursive DFS:       {time1*1000:.3f}ms")
+    print(f"1. Recursive-order DFS: {time1*1000:.3f}ms")
 
     # Iterative DFS
     start = time.perf_counter()
@@ -544,6 +1134,324 @@ def compare_dfs_methods():
     print(f"Note: Order may differ between methods")
 
 
+def compare_dense_dfs(n: int = 200_000, degree: int = 4, queries: int = 10, seed: int = 0):
+    """Repeated DFS queries: set-based dfs_iterative vs reused DFSWorkspace."""
+    import random
+    import time
+    import tracemalloc
+
+    rng = random.Random(seed)
+    graph = {u: [rng.randrange(n) for _ in range(degree)] for u in range(n)}
+    starts = rng.sample(range(n), queries)
+    workspace = DFSWorkspace(n)
+
+    def measure(fn):
+        best = float('inf')
+        for _ in range(3):
+            t0 = time.perf_counter()
+            results = [fn(s) for s in starts]
+            best = min(best, (time.perf_counter() - t0) / queries * 1000)
+        tracemalloc.start()  # Separate run: tracemalloc slows allocation-heavy code
+        fn(starts[0])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return results, best, peak
+
+    expected, set_ms, set_peak = measure(lambda s: dfs_iterative(graph, s))
+    result, dense_ms, dense_peak = measure(lambda s: dfs_iterative_dense(graph, s, n, workspace))
+
+    print(f"=== DFS STATE: set vs bytearray workspace ({n:,} vertices, per query) ===\n")
+    print(f"dfs_iterative (set):        {set_ms:8.1f}ms  peak {set_peak:>12,} B")
+    print(f"dfs_iterative_dense:        {dense_ms:8.1f}ms  peak {dense_peak:>12,} B  "
+          f"({set_ms/dense_ms:.1f}x), same: {result == expected}")
+
+
+def compare_recursion_free(n: int = 200_000, degree: int = 3, deep: int = 1_000_000, seed: int = 0):
+    """
+    Textbook recursive routines vs the explicit-stack versions in this file
+    (plus dfs_events, to show what the per-event hooks cost).
+
+    The recursive baselines live here only; they need sys.setrecursionlimit
+    raised (restored afterwards) just to run on a random graph.
+
+    ⚠️ NOT faster than recursion. On CPython 3.11+ Python-to-Python calls
+    are inlined, so plain recursion is cheap. Measured (3 runs, noisy box):
+        preorder 0.87-0.97x, topological sort 0.88-0.99x,
+        cycle (directed) 0.88-1.06x, components 0.90-1.04x,
+        preorder via dfs_events 0.60-0.81x (one generator switch per event)
+    The win is depth only - recursion dies past the limit, the explicit
+    stack does not.
+    """
+    import random
+    import sys
+    import time
+
+    rng = random.Random(seed)
+    directed = {u: [rng.randrange(u + 1, n) for _ in range(degree)] if u < n - 1 else []
+                for u in range(n)}  # Edges go forward only → a DAG
+    undirected = defaultdict(list)
+    for u in range(n):
+        for v in directed[u]:
+            undirected[u].append(v)
+            undirected[v].append(u)
+    undirected = dict(undirected)
+
+    def preorder_rec(graph, start):
+        visited, result = set(), []
+
+        def go(node):
+            visited.add(node)
+            result.append(node)
+            for neighbor in graph[node]:
+                if neighbor not in visited:
+                    go(neighbor)
+        go(start)
+        return result
+
+    def topo_rec(graph, n):
+        visited, order = set(), []
+
+        def go(node):
+            visited.add(node)
+            for neighbor in graph.get(node, []):
+                if neighbor not in visited:
+                    go(neighbor)
+            order.append(node)
+        for node in range(n):
+            if node not in visited and node in graph:
+                go(node)
+        return order[::-1]
+
+    def cycle_rec(graph):
+        visited, rec_stack = set(), set()
+
+        def go(node):
+            visited.add(node)
+            rec_stack.add(node)
+            for neighbor in graph[node]:
+                if neighbor not in visited:
+                    if go(neighbor):
+                        return True
+                elif neighbor in rec_stack:
+                    return True
+            rec_stack.remove(node)
+            return False
+        return any(node not in visited and go(node) for node in graph)
+
+    def components_rec(graph):
+        visited, components = set(), []
+
+        def go(node, component):
+            visited.add(node)
+            component.append(node)
+            for neighbor in graph[node]:
+                if neighbor not in visited:
+                    go(neighbor, component)
+        for node in graph:
+            if node not in visited:
+                components.append([])
+                go(node, components[-1])
+        return components
+
+    def best_of_5(fn):
+        best = float('inf')
+        for _ in range(5):
+            t0 = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - t0)
+        return result, best * 1000
+
+    cases = [
+        ("preorder", lambda: preorder_rec(undirected, 0), lambda: dfs_recursive(undirected, 0)),
+        ("preorder (events)", lambda: preorder_rec(undirected, 0),
+         lambda: [node for _, node, _ in dfs_events(undirected, [0], (PRE,))]),
+        ("topological sort", lambda: topo_rec(directed, n), lambda: dfs_topological_sort(directed, n)),
+        ("cycle (directed)", lambda: cycle_rec(directed), lambda: dfs_cycle_detection_directed(directed)),
+        ("components", lambda: components_rec(undirected), lambda: dfs_connected_components(undirected)),
+    ]
+
+    print(f"=== RECURSIVE vs EXPLICIT STACK ({n:,} vertices, {n * degree:,} edges) ===\n")
+    old_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(old_limit, 2 * n + 1000))
+    try:
+        for name, recursive, iterative in cases:
+            expected, rec_ms = best_of_5(recursive)
+            result, it_ms = best_of_5(iterative)
+            print(f"{name:<18} recursive {rec_ms:8.1f}ms  iterative {it_ms:8.1f}ms  "
+                  f"({rec_ms/it_ms:.2f}x), same: {result == expected}")
+    finally:
+        sys.setrecursionlimit(old_limit)
+
+    chain = {i: [i + 1] for i in range(deep - 1)}
+    chain[deep - 1] = []
+    t0 = time.perf_counter()
+    order = dfs_topological_sort(chain, deep)
+    print(f"\n{deep:,}-deep chain, topological sort at recursion limit {sys.getrecursionlimit()}: "
+          f"{(time.perf_counter() - t0)*1000:.1f}ms, ok: {order == list(range(deep))}")
+
+
+def compare_all_paths(layers: int = 16, dead_end: int = 40):
+    """
+    dfs_all_paths vs dfs_all_paths_iter vs count_paths_dag.
+
+    Graph: `layers` layers of 2 vertices, every vertex linked to both
+    vertices of the next layer (2^layers paths). Every layer vertex also
+    links to a shared dead-end hub with `dead_end` leaves that never reach
+    target - plain backtracking re-explores it for every path prefix.
+    """
+    import time
+    import tracemalloc
+
+    graph = defaultdict(list)
+    start, target = 0, 2 * layers + 1
+    hub = target + 1
+    graph[hub] = list(range(hub + 1, hub + 1 + dead_end))
+    for v in graph[hub]:
+        graph[v] = []
+    previous = [start]
+    for layer in range(layers):
+        current = [2 * layer + 1, 2 * layer + 2]
+        for u in previous:
+            graph[u].append(hub)  # Tried FIRST by every method
+            graph[u].extend(current)
+        previous = current
+    for u in previous:
+        graph[u].append(target)
+    graph[target] = []
+    graph = dict(graph)
+
+    def measure(fn):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - t0) * 1000
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result, elapsed, peak
+
+    def stream():
+        total = 0
+        for _ in dfs_all_paths_iter(graph, start, target):
+            total += 1
+        return total
+
+    print(f"=== ALL PATHS: {2 ** layers:,} paths, {dead_end}-leaf dead end off every vertex ===\n")
+    paths, ms, peak = measure(lambda: dfs_all_paths(graph, start, target))
+    print(f"dfs_all_paths (list):         {ms:8.1f}ms  peak {peak:>12,} B  paths {len(paths):,}")
+    count, ms, peak = measure(stream)
+    print(f"dfs_all_paths_iter (stream):  {ms:8.1f}ms  peak {peak:>12,} B  paths {count:,}")
+    first, ms, peak = measure(lambda: list(dfs_all_paths_iter(graph, start, target, max_paths=10)))
+    print(f"dfs_all_paths_iter (10):      {ms:8.1f}ms  peak {peak:>12,} B  same prefix: {first == paths[:10]}")
+    count, ms, peak = measure(lambda: count_paths_dag(graph, start, target))
+    print(f"count_paths_dag:              {ms:8.1f}ms  peak {peak:>12,} B  count {count:,}")
+
+
+def compare_biconnected(n: int = 1_000, chords: int = 500, big: int = 1_000_000, seed: int = 0):
+    """
+    Articulation points: "delete each vertex, recount components" vs
+    dfs_biconnected. Then one low-link pass on a `big`-vertex graph
+    (a long path with random chords → DFS depth ~big, no recursion).
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+
+    def sparse_graph(size, chords, path=False):
+        graph = {u: [] for u in range(size)}
+        for u in range(1, size):  # Random tree (or a path) + random chords
+            v = u - 1 if path else rng.randrange(u)
+            graph[u].append(v)
+            graph[v].append(u)
+        for _ in range(chords):
+            u, v = rng.randrange(size), rng.randrange(size)
+            if u != v:
+                graph[u].append(v)
+                graph[v].append(u)
+        return graph
+
+    def brute_force(graph):
+        base = len(dfs_connected_components(graph))
+        points = []
+        for v in graph:
+            rest = {u: [w for w in graph[u] if w != v] for u in graph if u != v}
+            if len(dfs_connected_components(rest)) > base - (not graph[v]):
+                points.append(v)
+        return points
+
+    graph = sparse_graph(n, chords)
+    print(f"=== ARTICULATION POINTS ({n:,} vertices) ===\n")
+    t0 = time.perf_counter()
+    expected = brute_force(graph)
+    brute_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    points, bridges, components = dfs_biconnected(graph)
+    tarjan_ms = (time.perf_counter() - t0) * 1000
+    print(f"delete + recount (O(V·(V+E))): {brute_ms:9.1f}ms")
+    print(f"dfs_biconnected (O(V+E)):      {tarjan_ms:9.1f}ms  ({brute_ms/tarjan_ms:.0f}x), "
+          f"same: {sorted(points) == sorted(expected)}")
+    print(f"  {len(points)} articulation points, {len(bridges)} bridges, {len(components)} components")
+
+    graph = sparse_graph(big, big // 10, path=True)
+    t0 = time.perf_counter()
+    points, bridges, components = dfs_biconnected(graph)
+    print(f"\n{big:,}-vertex path + chords: {(time.perf_counter() - t0)*1000:.0f}ms, "
+          f"{len(points):,} articulation points, {len(bridges):,} bridges, {len(components):,} components")
+
+
+def compare_intervals(n: int = 50_000, degree: int = 3, queries: int = 100, seed: int = 0):
+    """
+    Ancestor / subtree queries on one DFS tree: walking parent pointers and
+    re-traversing children per question vs dfs_intervals labels.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    graph = [[rng.randrange(n) for _ in range(degree)] for _ in range(n)]
+
+    parent = [-1] * n  # Baseline keeps only the tree itself
+    children = [[] for _ in range(n)]
+    for _, node, came_from in dfs_events(graph, [0], (PRE,)):
+        if came_from is not None:
+            parent[node] = came_from
+            children[came_from].append(node)
+    reached = [v for v in range(n) if v == 0 or parent[v] != -1]
+    pairs = [(rng.choice(reached), rng.choice(reached)) for _ in range(queries)]
+
+    def is_ancestor_walk(u, v):
+        while v != -1:  # O(depth)
+            if v == u:
+                return True
+            v = parent[v]
+        return False
+
+    def subtree_walk(u):
+        result, stack = [], [u]  # O(subtree) traversal per question
+        while stack:
+            node = stack.pop()
+            result.append(node)
+            stack.extend(reversed(children[node]))
+        return result
+
+    t0 = time.perf_counter()
+    labels = dfs_intervals(graph, 0)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    expected = [(is_ancestor_walk(u, v), len(subtree_walk(u))) for u, v in pairs]
+    walk_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    result = [(labels.is_ancestor(u, v), len(labels.subtree(u))) for u, v in pairs]
+    label_ms = (time.perf_counter() - t0) * 1000
+
+    print(f"=== DFS INTERVALS ({len(reached):,} reached vertices, {queries} ancestor + subtree queries) ===\n")
+    print(f"parent walk + re-traversal:  {walk_ms:9.1f}ms")
+    print(f"dfs_intervals labels:        {label_ms:9.1f}ms  ({walk_ms/label_ms:.0f}x), "
+          f"same: {result == expected}, one-time build {build_ms:.1f}ms")
+
+
 # ============================================================
 # TEST CASES
 # ============================================================
@@ -572,6 +1480,15 @@ def run_tests():
     print("\n3. Iterative DFS (alternative):")
     print(f"   Result: {dfs_iterative_alternative(graph, 0)}")
 
+    print("\n3b. Lazy DFS (generator):")
+    print(f"   Result: {list(dfs_iter(graph, 0))}")
+    print(f"   First vertex > 3: {next(v for v in dfs_iter(graph, 0) if v > 3)}")
+
+    print("\n3c. Dense-ID DFS (bytearray workspace):")
+    workspace = DFSWorkspace(len(graph))
+    print(f"   From 0: {dfs_iterative_dense(graph, 0, len(graph), workspace)}")
+    print(f"   From 5: {dfs_iterative_dense(graph, 5, len(graph), workspace)}  (same workspace, no clearing)")
+
     print("\n4. DFS Path Finding:")
     path = dfs_recursive_with_path(graph, 0, 5)
     print(f"   Path 0→5: {path}")
@@ -580,6 +1497,9 @@ def run_tests():
     all_paths = dfs_all_paths(graph, 0, 5)
     for i, p in enumerate(all_paths, 1):
         print(f"   Path {i}: {p}")
+    print(f"   Lazy, max_paths=1: {list(dfs_all_paths_iter(graph, 0, 5, max_paths=1))}")
+    dag = {0: [1, 2], 1: [3], 2: [3], 3: []}
+    print(f"   DAG {dag} paths 0→3: {count_paths_dag(dag, 0, 3)}")
 
     print("\n6. Cycle Detection (Directed):")
     cycle_graph = {0: [1], 1: [2], 2: [0]}
@@ -599,9 +1519,35 @@ def run_tests():
     }
     components = dfs_connected_components(disconnected)
     print(f"   Components: {components}")
+    print(f"   Dense:      {dfs_connected_components_dense(disconnected)}")
+
+    print("\n9. Articulation Points / Bridges / Biconnected Components:")
+    network = {0: [1], 1: [0, 2, 3], 2: [1, 3], 3: [1, 2], 4: [5], 5: [4]}
+    points, bridges, blocks = dfs_biconnected(network)
+    print(f"   Graph {network}")
+    print(f"   Articulation points: {points}, bridges: {bridges}")
+    print(f"   Biconnected components: {blocks}")
+
+    print("\n10. DFS Interval Labels (O(1) ancestor / subtree):")
+    tree = {0: [1, 2], 1: [3], 2: [4], 3: [], 4: []}
+    labels = dfs_intervals(tree, 0)
+    print(f"   Preorder: {list(labels.order)}, post-order: {list(labels.post)}")
+    print(f"   tin: {list(labels.tin)}, tout: {list(labels.tout)}")
+    print(f"   1 ancestor of 3: {labels.is_ancestor(1, 3)}, 1 ancestor of 4: {labels.is_ancestor(1, 4)}")
+    print(f"   Subtree of 2: {list(labels.subtree(2))}")
 
     print("\n" + "="*60)
     compare_dfs_methods()
+    print()
+    compare_dense_dfs()
+    print()
+    compare_recursion_free()
+    print()
+    compare_all_paths()
+    print()
+    compare_biconnected()
+    print()
+    compare_intervals()
 
 
 if __name__ == "__main__":
@@ -657,7 +1603,7 @@ Connected Components         | O(V + E)  | O(V)      | Graph clustering
        → Duplicate processing
 
 ❌ 3. Using recursion on very deep graphs
-       → RecursionError
+       → RecursionError (fix: explicit stack, see dfs_events)
 
 ❌ 4. Not handling disconnected components
        → Missing parts of graph
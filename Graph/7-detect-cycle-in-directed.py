@@ -50,6 +50,7 @@ if a node is in the current path, we found a back edge, which means a cycle."
 """
 
 from typing import List
+from array import array
 from collections import defaultdict
 
 
@@ -102,6 +103,174 @@ class Solution:
         pathVisited.remove(start)  # Backtrack - remove from current path
         return False  # No cycle found from this node
 
+    def findTangledCourses(self, numCourses: int, prerequisites: List[List[int]]) -> List[List[int]]:
+        """
+        canFinish says "no" - this says WHICH courses are stuck.
+
+        A course is tangled iff it sits in a strongly connected component
+        (SCC) with more than one course, or requires itself. One SCC pass
+        answers it for every course - no per-node cycle search.
+
+        Time: O(V + E)
+        Space: O(V)
+        """
+        graph = self.createGraph(numCourses, prerequisites)
+        labels, count = self.stronglyConnectedComponents(graph, numCourses)
+
+        members = [[] for _ in range(count)]
+        for course in range(numCourses):
+            members[labels[course]].append(course)
+
+        selfLoop = {y for x, y in prerequisites if x == y}
+        return [group for group in members if len(group) > 1 or group[0] in selfLoop]
+
+    def stronglyConnectedComponents(self, graph, V):
+        """
+        Iterative Tarjan SCC on vertices 0..V-1.
+
+        Returns (labels, count): labels[v] = component of v, as array('i').
+        Labels are TOPOLOGICAL - every edge between components goes from a
+        smaller label to a larger one, so 0..count-1 is a topo order of the
+        condensation (Tarjan finishes sink components first; we flip them).
+
+        Same DFS as dfsHasCycle, but with an explicit stack of
+        (node, neighbor iterator) frames → no recursion limit.
+            index[v]: DFS discovery time
+            low[v]:   smallest index reachable via v's subtree + one back edge
+            low[v] == index[v] → v is the root of an SCC: pop it off sccStack
+
+        Time: O(V + E)
+        Space: O(V) - a few int arrays + stacks
+        """
+        index = array('i', [-1]) * V
+        low = array('i', [0]) * V
+        onStack = bytearray(V)
+        labels = array('i', [-1]) * V
+        sccStack = []
+        counter = 0
+        count = 0
+
+        for root in range(V):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            sccStack.append(root)
+            onStack[root] = 1
+            work = [(root, iter(graph.get(root, ())))]
+
+            while work:
+                node, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if index[neighbor] == -1:  # Tree edge → "recurse"
+                        index[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        sccStack.append(neighbor)
+                        onStack[neighbor] = 1
+                        work.append((neighbor, iter(graph.get(neighbor, ()))))
+                        break
+                    if onStack[neighbor] and index[neighbor] < low[node]:
+                        low[node] = index[neighbor]  # Back/cross edge inside current SCC
+                else:  # All neighbors done → "return"
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low[node] < low[parent]:
+                            low[parent] = low[node]
+                    if low[node] == index[node]:  # node is an SCC root
+                        while True:
+                            member = sccStack.pop()
+                            onStack[member] = 0
+                            labels[member] = count
+                            if member == node:
+                                break
+                        count += 1
+
+        for v in range(V):  # Finish order is reverse topological → flip
+            labels[v] = count - 1 - labels[v]
+        return labels, count
+
+    def condensation(self, graph, V, labels, count):
+        """
+        Condensed DAG (one vertex per SCC) as CSR: (offsets, targets).
+
+        Component c's successors are targets[offsets[c]:offsets[c + 1]],
+        deduplicated, no self-loops. Bucket vertices by label, then walk each
+        component's edges once; lastSeen[d] == c marks "edge c → d already added".
+
+        Time: O(V + E)
+        Space: O(V + E') where E' = number of condensed edges
+        """
+        start = array('i', [0]) * (count + 1)  # Counting sort of vertices by label
+        for v in range(V):
+            start[labels[v] + 1] += 1
+        for c in range(count):
+            start[c + 1] += start[c]
+        byComponent = array('i', [0]) * V
+        fill = start[:]
+        for v in range(V):
+            byComponent[fill[labels[v]]] = v
+            fill[labels[v]] += 1
+
+        offsets = array('i', [0]) * (count + 1)
+        targets = array('i')
+        lastSeen = array('i', [-1]) * count
+        for c in range(count):
+            for i in range(start[c], start[c + 1]):
+                for neighbor in graph.get(byComponent[i], ()):
+                    d = labels[neighbor]
+                    if d != c and lastSeen[d] != c:
+                        lastSeen[d] = c
+                        targets.append(d)
+            offsets[c + 1] = len(targets)
+        return offsets, targets
+
+    def condensationTopoSort(self, offsets, targets, count):
+        """
+        Kahn's algorithm on the condensed CSR DAG → component ids in topological order.
+
+        The condensation is always a DAG, so this never gets stuck - the usual
+        "queue ran dry before count" cycle check cannot fire here.
+
+        Time: O(count + E')
+        Space: O(count) - indegree + the order array, which doubles as the queue
+        """
+        indegree = array('i', [0]) * count
+        for d in targets:
+            indegree[d] += 1
+        order = array('i', [c for c in range(count) if indegree[c] == 0])
+        head = 0
+        while head < len(order):  # order[head:] is the queue
+            c = order[head]
+            head += 1
+            for i in range(offsets[c], offsets[c + 1]):
+                d = targets[i]
+                indegree[d] -= 1
+                if indegree[d] == 0:
+                    order.append(d)
+        return order
+
+    def findCourseOrderWithCycles(self, numCourses: int, prerequisites: List[List[int]]) -> List[List[int]]:
+        """
+        Course order for ANY prerequisite graph, cycles included.
+
+        Topological sort needs a DAG, so sort the condensation instead:
+        SCC → condensation CSR → Kahn. Each returned group is one SCC -
+        a single course, or courses that require each other and must be
+        taken together. Groups come out in a valid order.
+
+        Time: O(V + E)
+        Space: O(V + E')
+        """
+        graph = self.createGraph(numCourses, prerequisites)
+        labels, count = self.stronglyConnectedComponents(graph, numCourses)
+        offsets, targets = self.condensation(graph, numCourses, labels, count)
+
+        members = [[] for _ in range(count)]
+        for course in range(numCourses):
+            members[labels[course]].append(course)
+        return [members[c] for c in self.condensationTopoSort(offsets, targets, count)]
+
     def createGraph(self, numCourses, prereq):
         """Build adjacency list from edge list."""
         graph = defaultdict(list)
@@ -126,3 +295,36 @@ COMMON MISTAKES:
 ❌ Forgetting pathVisited.remove(start) → False positives
 ❌ Not checking disconnected components → Missing cycles
 ❌ Using BFS → Can't detect cycles in directed graphs reliably
+
+WHEN canFinish SAYS NO:
+=======================
+✅ findTangledCourses → the actual cycles (SCCs with > 1 course or a self-loop)
+✅ stronglyConnectedComponents → labels in topo order of the condensation
+✅ condensation → SCC DAG as CSR: any DAG algorithm (topo sort, DAG shortest
+   path - see findShortestPathGeneral in 13.shortest-path-topo.py) now works
+   on ANY directed graph by running on components instead of nodes
+✅ condensationTopoSort → Kahn on the condensation CSR;
+   findCourseOrderWithCycles → a course order (in SCC groups) even with cycles
+✅ 13.shortest-path-topo.py loads THIS stronglyConnectedComponents by path -
+   it is the only Tarjan in the repo, change it here
+"""
+
+
+def main():
+    solution = Solution()
+    # 0 → 1 → 2 → 3 → 1 (cycle 1-2-3), 4 → 4 (self-loop), 5 free
+    prerequisites = [[1, 0], [2, 1], [3, 2], [1, 3], [4, 4], [5, 3]]
+    print(solution.canFinish(6, prerequisites))              # False
+    print(solution.findTangledCourses(6, prerequisites))     # [[4], [1, 2, 3]]
+
+    graph = solution.createGraph(6, prerequisites)
+    labels, count = solution.stronglyConnectedComponents(graph, 6)
+    offsets, targets = solution.condensation(graph, 6, labels, count)
+    print(list(labels), count)
+    print([list(targets[offsets[c]:offsets[c + 1]]) for c in range(count)])
+    print(list(solution.condensationTopoSort(offsets, targets, count)))
+    print(solution.findCourseOrderWithCycles(6, prerequisites))  # [[4], [0], [1, 2, 3], [5]]
+
+
+if __name__ == '__main__':
+    main()